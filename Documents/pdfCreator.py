@@ -26,31 +26,37 @@ class PDF(FPDF):
         self.multi_cell(width - 2, 10, text)  # Adjust to fit within the box
 
 
-# Create an instance of the PDF class
-pdf = PDF()
+def main():
+    """Create the sample PDF with link and text annotations."""
+    # Create an instance of the PDF class
+    pdf = PDF()
 
-# Add a page
-pdf.add_page()
+    # Add a page
+    pdf.add_page()
 
-# Set font for main content
-pdf.set_font("Arial", size=12)
+    # Set font for main content
+    pdf.set_font("Arial", size=12)
 
-# Add some text
-pdf.cell(0, 10, "This is a PDF with annotations (links and text boxes).", ln=True)
+    # Add some text
+    pdf.cell(0, 10, "This is a PDF with annotations (links and text boxes).", ln=True)
 
-# Add a clickable link annotation
-pdf.set_xy(10, 30)
-pdf.set_font("Arial", 'U', 12)
-pdf.set_text_color(0, 0, 255)  # Blue color for link
-pdf.cell(0, 10, 'Visit OpenAI website', ln=True)
-pdf.add_link_annotation(10, 30, 80, 10, "https://www.openai.com")
+    # Add a clickable link annotation
+    pdf.set_xy(10, 30)
+    pdf.set_font("Arial", 'U', 12)
+    pdf.set_text_color(0, 0, 255)  # Blue color for link
+    pdf.cell(0, 10, 'Visit OpenAI website', ln=True)
+    pdf.add_link_annotation(10, 30, 80, 10, "https://www.openai.com")
 
-# Add a text box annotation
-pdf.set_xy(10, 50)
-pdf.add_text_annotation(10, 50, 80, 20, "This is a text annotation inside a box. It can be used to comment on specific areas.")
+    # Add a text box annotation
+    pdf.set_xy(10, 50)
+    pdf.add_text_annotation(10, 50, 80, 20, "This is a text annotation inside a box. It can be used to comment on specific areas.")
 
-# Save the PDF
-pdf_file_path = "annotations.pdf"
-pdf.output(pdf_file_path)
+    # Save the PDF
+    pdf_file_path = "annotations.pdf"
+    pdf.output(pdf_file_path)
 
-print("PDF with annotations created successfully!")
+    print("PDF with annotations created successfully!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+from datetime import datetime
+
+# One formatter shared by every handler of the test run
+_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+# Handlers attached by install(); empty until the first call
+_HANDLERS = []
+
+# The QueueHandler on the root logger and the listener thread that feeds _HANDLERS from it
+_QUEUE_HANDLER = []
+_LISTENER = []
+
+
+def install(log_dir=os.path.join(os.path.dirname(__file__), 'log_dir')):
+    """Attach the test-results file handler and a console handler to the root logger.
+
+    The root logger only gets a QueueHandler; a QueueListener thread does the file and console
+    writes, so tests never block on log I/O.
+
+    Calling it again in the same process does nothing, so records are never written twice.
+
+    Args:
+        log_dir (str): Directory for the timestamped test-results log file.
+    """
+    logger = logging.getLogger()
+    if _QUEUE_HANDLER and _QUEUE_HANDLER[0] in logger.handlers:
+        return
+    os.makedirs(log_dir, exist_ok=True)
+    # Under pytest-xdist every worker process logs to its own file instead of clobbering one shared file
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    suffix = f"_{worker}" if worker else ""
+    log_filename = os.path.join(log_dir, f'test_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}{suffix}.log')
+
+    _HANDLERS[:] = [logging.FileHandler(log_filename, 'w'), logging.StreamHandler()]
+    for handler in _HANDLERS:
+        handler.setFormatter(_FORMATTER)
+
+    records = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(records, *_HANDLERS, respect_handler_level=True)
+    listener.start()
+    _LISTENER[:] = [listener]
+    _QUEUE_HANDLER[:] = [logging.handlers.QueueHandler(records)]
+    logger.addHandler(_QUEUE_HANDLER[0])
+    logger.setLevel(logging.DEBUG)
+    # Flush queued records even if the run ends without pytest_unconfigure
+    atexit.register(uninstall)
+
+
+def uninstall():
+    """Detach the handlers added by install(), writing out queued records before closing them."""
+    logger = logging.getLogger()
+    for handler in _QUEUE_HANDLER:
+        logger.removeHandler(handler)
+    for listener in _LISTENER:
+        listener.stop()
+    for handler in _HANDLERS:
+        handler.close()
+    _QUEUE_HANDLER.clear()
+    _LISTENER.clear()
+    _HANDLERS.clear()
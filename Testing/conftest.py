@@ -0,0 +1,97 @@
+import copy
+import os
+import sys
+
+import pytest
+
+import _log_setup
+
+# Make the modules under src importable from every test module; conftest.py is loaded before them.
+# Any earlier copy of the entry is removed first, so re-importing conftest never duplicates it.
+_SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path[:] = [path for path in sys.path if path != _SRC_DIR]
+sys.path.insert(0, _SRC_DIR)
+
+from file_loaders import PDFLoader, DOCXLoader, PPTLoader, _open_pdf, _open_docx, _open_pptx, _open_plumber
+from fast_fixtures import make_pdf_loader_stub, make_docx_loader_stub, make_ppt_loader_stub
+
+# Sample documents shipped with the repository
+DOCUMENTS_DIR = os.path.join(os.path.dirname(__file__), '..', 'Documents')
+
+
+def pytest_configure(config):
+    """Set up test logging once per run."""
+    _log_setup.install()
+
+
+def pytest_unconfigure(config):
+    """Remove the handlers added by pytest_configure."""
+    _log_setup.uninstall()
+
+
+@pytest.fixture(autouse=True)
+def _clear_document_caches():
+    """Forget the documents parsed during a test; tests patch the parsers, so a cached mock must not leak."""
+    yield
+    for opener in (_open_pdf, _open_docx, _open_pptx, _open_plumber):
+        opener.cache_clear()
+
+
+# Loader fixtures: each stubbed loader is built once per session and handed to tests as a
+# shallow copy, so tests can rebind attributes without rebuilding the stubs.
+
+@pytest.fixture(scope="session")
+def _pdf_loader_proto():
+    return make_pdf_loader_stub()
+
+@pytest.fixture(scope="session")
+def _docx_loader_proto():
+    return make_docx_loader_stub()
+
+@pytest.fixture(scope="session")
+def _ppt_loader_proto():
+    return make_ppt_loader_stub()
+
+@pytest.fixture
+def mock_pdf_loader(_pdf_loader_proto):
+    return copy.copy(_pdf_loader_proto)
+
+@pytest.fixture
+def mock_docx_loader(_docx_loader_proto):
+    return copy.copy(_docx_loader_proto)
+
+@pytest.fixture
+def mock_ppt_loader(_ppt_loader_proto):
+    return copy.copy(_ppt_loader_proto)
+
+
+# Loaders for the sample documents. Constructing a loader does not open the file, and the
+# validation tests only read its path, so one instance per type serves the whole session.
+
+@pytest.fixture(scope="session")
+def pdf_loader():
+    return PDFLoader(os.path.join(DOCUMENTS_DIR, 'sample.pdf'))
+
+@pytest.fixture(scope="session")
+def docx_loader():
+    return DOCXLoader(os.path.join(DOCUMENTS_DIR, 'sample.docx'))
+
+@pytest.fixture(scope="session")
+def ppt_loader():
+    return PPTLoader(os.path.join(DOCUMENTS_DIR, 'sample.pptx'))
+
+
+# Factories for tests that call load(). Loading opens the file and caches the document on the
+# loader, so these tests build a fresh loader inside the test body rather than in a fixture.
+
+@pytest.fixture(scope="session")
+def pdf_loader_factory():
+    return lambda: PDFLoader(os.path.join(DOCUMENTS_DIR, 'sample.pdf'))
+
+@pytest.fixture(scope="session")
+def docx_loader_factory():
+    return lambda: DOCXLoader(os.path.join(DOCUMENTS_DIR, 'sample.docx'))
+
+@pytest.fixture(scope="session")
+def ppt_loader_factory():
+    return lambda: PPTLoader(os.path.join(DOCUMENTS_DIR, 'sample.pptx'))
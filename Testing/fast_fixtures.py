@@ -0,0 +1,45 @@
+"""Builders for the stubbed loaders used by the extractor tests.
+
+Kept free of pytest so they can be reused outside fixtures; conftest.py wraps them in
+session-scoped prototypes.
+"""
+from types import SimpleNamespace
+
+from docx.enum.style import WD_STYLE_TYPE
+
+from file_loaders import PDFLoader, DOCXLoader, PPTLoader
+
+
+def make_pdf_loader_stub(text="Sample text", font="Helvetica"):
+    """Return a PDFLoader whose document is a single stub page with the given text."""
+    loader = PDFLoader("sample.pdf")
+    page_dict = {"blocks": [{"lines": [{"spans": [{"text": text, "font": font}]}]}]}
+    page = SimpleNamespace(get_text=lambda *args, **kwargs: page_dict)  # Stub PDF page structured text extraction
+    loader.doc = [page]  # A list supports the len() and iteration the extractor uses; load() keeps it
+    return loader
+
+
+def make_docx_loader_stub(text="Sample text", style="Normal"):
+    """Return a DOCXLoader whose document body is a single stub w:p element with the given paragraph style."""
+    loader = DOCXLoader("sample.docx")
+    paragraph = SimpleNamespace(text=text, style=style)  # CT_P exposes the pStyle id as .style
+    body = SimpleNamespace(iterchildren=lambda tag: iter([paragraph]))
+    styles = _StubStyles([SimpleNamespace(style_id=style, name=style, type=WD_STYLE_TYPE.PARAGRAPH)])
+    loader.doc = SimpleNamespace(element=SimpleNamespace(body=body), styles=styles)  # Stub DOCX body and styles
+    return loader
+
+
+class _StubStyles(list):
+    """A list of styles with the default() lookup of python-docx's Styles."""
+
+    def default(self, style_type):
+        return self[0] if self else None
+
+
+def make_ppt_loader_stub(text="Sample slide text"):
+    """Return a PPTLoader whose presentation is a single slide with one text shape."""
+    loader = PPTLoader("sample.pptx")
+    shape = SimpleNamespace(text=text, has_text_frame=False)  # Stub a slide shape and its text
+    slide = SimpleNamespace(shapes=[shape])
+    loader.presentation = SimpleNamespace(slides=[slide])  # Stub PPTX slides
+    return loader
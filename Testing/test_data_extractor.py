@@ -1,52 +1,91 @@
 import pytest
-import os
-import logging
+from collections import OrderedDict
+from types import SimpleNamespace
 from unittest.mock import MagicMock
-import sys
-import os
 
-# Append the src directory to the system path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
 
-from file_loaders import PDFLoader, DOCXLoader, PPTLoader
-
-from data_extractor import DataExtractor
-from storage import FileStorage, MySQLStorage
-from unittest.mock import MagicMock
-import pytest
+from file_loaders import FileLoader, _pdf_page_images
 from data_extractor import DataExtractor
 
-@pytest.fixture
-def mock_pdf_loader():
-    loader = MagicMock()
-    loader.__class__ = PDFLoader  # Simulate that this is a PDFLoader
-    loader.doc = MagicMock()  # Mock the 'doc' attribute
-    loader.doc.load_page = MagicMock(return_value=MagicMock(get_text=MagicMock(return_value="Sample text")))  # Mock PDF page text extraction
-    return loader
-
-@pytest.fixture
-def mock_docx_loader():
-    loader = MagicMock()
-    loader.__class__ = DOCXLoader  # Simulate that this is a DOCXLoader
-    loader.doc = MagicMock()  # Mock the 'doc' attribute
-    loader.doc.paragraphs = [MagicMock(text="Sample text", style=MagicMock(name="Normal"))]  # Mock DOCX paragraphs
-    return loader
-
-@pytest.fixture
-def mock_ppt_loader():
-    loader = MagicMock()
-    loader.__class__ = PPTLoader  # Simulate that this is a PPTLoader
-    loader.presentation = MagicMock()  # Mock the 'presentation' attribute
-    slide_mock = MagicMock()
-    slide_mock.shapes = [MagicMock(text="Sample slide text")]  # Mock slide shapes and text
-    loader.presentation.slides = [slide_mock]  # Mock PPTX slides
-    return loader
-
 def test_extract_pdf_text(mock_pdf_loader):
     """Test extracting text from a PDF."""
     extractor = DataExtractor(mock_pdf_loader)
     result = extractor.extract_text()
-    assert result == [{"page_number": 1, "text": "Sample text"}]
+    assert result == [{"page_number": 1, "text": "Sample text\n", "fonts": ["Helvetica"]}]
+
+def test_extract_pdf_images_reuses_repeated_xref(mock_pdf_loader):
+    """An image shown on several pages (same xref) is extracted from the PDF only once."""
+    page = SimpleNamespace(get_images=lambda: [(7,)])
+    extract_image = MagicMock(return_value={"image": b"logo", "ext": "png"})
+
+    class Doc(list):
+        pass  # a list of pages that also takes the extract_image attribute
+
+    mock_pdf_loader.doc = Doc([page, page, page])
+    mock_pdf_loader.doc.extract_image = extract_image
+
+    images = DataExtractor(mock_pdf_loader, workers=1).extract_images()
+
+    assert [image["page_number"] for image in images] == [1, 2, 3]
+    assert all(image["image_data"] == b"logo" for image in images)
+    extract_image.assert_called_once_with(7)
+
+def test_pdf_page_images_evicts_least_recently_used(mocker):
+    """The image cache drops the image whose xref was used longest ago, not the first one extracted."""
+    mocker.patch('file_loaders.PDF_IMAGE_CACHE_SIZE', 2)
+    doc = SimpleNamespace(extract_image=MagicMock(side_effect=lambda xref: {"image": bytes([xref]), "ext": "png"}))
+    seen = OrderedDict()
+
+    for page_num, xrefs in enumerate([[1], [2], [1], [3], [1]]):
+        page = SimpleNamespace(get_images=lambda xrefs=xrefs: [(xref,) for xref in xrefs])
+        _pdf_page_images(doc, page, page_num, seen)
+
+    assert [call.args[0] for call in doc.extract_image.call_args_list] == [1, 2, 3]
+    assert list(seen) == [3, 1]
+
+def test_extract_docx_images_from_document_part(mock_docx_loader):
+    """Only images related to the document part are extracted, not the package thumbnail or external images."""
+    image_part = SimpleNamespace(blob=b"img", partname=SimpleNamespace(ext="PNG"))
+    rels = {
+        "rId1": SimpleNamespace(reltype=RT.IMAGE, is_external=False, target_part=image_part),
+        "rId2": SimpleNamespace(reltype=RT.IMAGE, is_external=True, target_ref="http://example.com/a.png"),
+        "rId3": SimpleNamespace(reltype=RT.HYPERLINK, is_external=True, target_ref="http://example.com"),
+    }
+    mock_docx_loader.doc = SimpleNamespace(part=SimpleNamespace(rels=rels))
+
+    images = DataExtractor(mock_docx_loader).extract_images()
+
+    assert images == [{"image_data": b"img", "image_extension": "png"}]
+
+def test_extract_docx_links(mock_docx_loader):
+    """Links come from non-empty hyperlink relationships and from HYPERLINK fields, also when split over runs."""
+    rels = {
+        "rId1": SimpleNamespace(reltype=RT.HYPERLINK, target_ref="https://www.python.org"),
+        "rId2": SimpleNamespace(reltype=RT.HYPERLINK, target_ref=""),
+        "rId3": SimpleNamespace(reltype=RT.IMAGE, target_ref="media/image1.jpeg"),
+    }
+    body = parse_xml(
+        f'<w:body {nsdecls("w")}><w:p>'
+        '<w:r><w:fldChar w:fldCharType="begin"/></w:r>'
+        '<w:r><w:instrText xml:space="preserve"> HYPERLINK "https://example.com/a" </w:instrText></w:r>'
+        '<w:r><w:instrText xml:space="preserve">\\l "top of page" </w:instrText></w:r>'
+        '<w:r><w:fldChar w:fldCharType="separate"/></w:r>'
+        '<w:r><w:t>Example</w:t></w:r>'
+        '<w:r><w:fldChar w:fldCharType="end"/></w:r>'
+        '<w:fldSimple w:instr=" PAGE "><w:r><w:t>1</w:t></w:r></w:fldSimple>'
+        '</w:p></w:body>'
+    )
+    mock_docx_loader.doc = SimpleNamespace(part=SimpleNamespace(rels=rels), element=SimpleNamespace(body=body))
+
+    links = DataExtractor(mock_docx_loader).extract_links()
+
+    assert links == [
+        {"url": "https://www.python.org", "style": None},
+        {"url": "https://example.com/a#top%20of%20page", "style": None},
+    ]
 
 def test_extract_docx_text(mock_docx_loader):
     """Test extracting text from a DOCX."""
@@ -59,3 +98,31 @@ def test_extract_ppt_text(mock_ppt_loader):
     extractor = DataExtractor(mock_ppt_loader)
     result = extractor.extract_text()
     assert result == [{"slide_number": 1, "text": "Sample slide text"}]
+
+def test_extract_ppt_all_reads_text_and_links(mock_ppt_loader):
+    """Text and hyperlinks of a PPTX come out of the same pass over the slide shapes."""
+    run = SimpleNamespace(hyperlink=SimpleNamespace(address="https://example.com"))
+    text_frame = SimpleNamespace(paragraphs=[SimpleNamespace(runs=[run])])
+    shape = SimpleNamespace(text="Linked text", has_text_frame=True, text_frame=text_frame, has_table=False)
+    mock_ppt_loader.presentation = SimpleNamespace(slides=[SimpleNamespace(shapes=[shape])])
+
+    extractor = DataExtractor(mock_ppt_loader)
+    text, links, images, tables = extractor.extract_all(include_images=False)
+
+    assert text == [{"slide_number": 1, "text": "Linked text"}]
+    assert links == [{"slide_number": 1, "url": "https://example.com"}]
+    assert images is None
+    assert tables == []
+
+def test_extract_text_unsupported_loader():
+    """Loaders that don't implement an extraction method raise a RuntimeError."""
+    class TXTLoader(FileLoader):
+        def __init__(self, file_path):
+            super().__init__(file_path, '.txt')
+
+        def load(self):
+            return None
+
+    extractor = DataExtractor(TXTLoader("notes.txt"))
+    with pytest.raises(RuntimeError, match="Unsupported file type"):
+        extractor.extract_text()
@@ -2,49 +2,28 @@ import pytest
 import os
 import logging
 from unittest.mock import MagicMock
-from datetime import datetime
-import sys
 
-# Import mocker from pytest-mock if needed
-from pytest_mock import mocker 
-
-# Append the src directory to the system path if not already done
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from file_loaders import PDFLoader, DOCXLoader, PPTLoader
+from file_loaders import PDFLoader, DOCXLoader, PPTLoader, FileLoaderRegistry
 
 # Sample file paths
-pdf_path = '/home/shtlp_0103/Assignment_3/Documents/sample.pdf'
-docx_path = '/home/shtlp_0103/Assignment_3/Documents/sample.docx'
-pptx_path = '/home/shtlp_0103/Assignment_3/Documents/sample.pptx'
-output_folder = '/home/shtlp_0103/Assignment_3/Testing/log_dir'
-
-# Set up logging to file and console
-log_filename = os.path.join(output_folder, f'test_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
-file_handler = logging.FileHandler(log_filename, 'w')
-console_handler = logging.StreamHandler()
-
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-file_handler.setFormatter(formatter)
-console_handler.setFormatter(formatter)
-
-logger = logging.getLogger()
-logger.setLevel(logging.DEBUG)
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+documents_dir = os.path.join(os.path.dirname(__file__), '..', 'Documents')
+pdf_path = os.path.join(documents_dir, 'sample.pdf')
+docx_path = os.path.join(documents_dir, 'sample.docx')
+pptx_path = os.path.join(documents_dir, 'sample.pptx')
 
 def test_logging():
     logging.info("Test case for logging.")
     assert True
 
-# PDFLoader Tests
-def test_pdf_loader_valid_file():
-    pdf_loader = PDFLoader(pdf_path)
+# Loader Tests
+@pytest.mark.parametrize("loader_fixture", ["pdf_loader", "docx_loader", "ppt_loader"])
+def test_loader_valid_file(loader_fixture, request):
+    loader = request.getfixturevalue(loader_fixture)
     try:
-        pdf_loader.validate_extension()
-        logging.info("PDFLoader: Valid PDF file test passed.")
+        loader.validate_extension()
+        logging.info(f"{type(loader).__name__}: Valid file test passed.")
     except ValueError:
-        pytest.fail("PDFLoader: File validation failed for a valid PDF file.")
+        pytest.fail(f"{type(loader).__name__}: File validation failed for a valid file.")
 
 def test_pdf_loader_invalid_file():
     pdf_loader = PDFLoader('invalid.txt')
@@ -52,41 +31,86 @@ def test_pdf_loader_invalid_file():
         pdf_loader.validate_extension()
     logging.info("PDFLoader: Invalid file format test passed.")
 
-def test_pdf_loader_load_method(mocker):
-    pdf_loader = PDFLoader(pdf_path)
+@pytest.mark.parametrize("factory_fixture,path,patch_target", [
+    ("pdf_loader_factory", pdf_path, 'fitz.open'),
+    ("docx_loader_factory", docx_path, 'docx.Document'),
+    # file_loaders imports Presentation by name, so it is patched where it is looked up
+    ("ppt_loader_factory", pptx_path, 'file_loaders.Presentation'),
+])
+def test_loader_load_method(factory_fixture, path, patch_target, request, mocker):
+    loader = request.getfixturevalue(factory_fixture)()
+    mock_open = mocker.patch(patch_target, return_value=MagicMock())
+    assert loader.load() is not None, f"{type(loader).__name__}: Failed to load a valid file."
+    logging.info(f"{type(loader).__name__}: Loading test passed.")
+    mock_open.assert_called_once_with(path)
+
+def test_pdf_loader_load_is_cached(mocker):
     mock_open = mocker.patch('fitz.open', return_value=MagicMock())
-    assert pdf_loader.load() is not None, "PDFLoader: Failed to load a valid PDF."
-    logging.info("PDFLoader: PDF loading test passed.")
-    mock_open.assert_called_once_with(pdf_path)
+    first = PDFLoader('cached.pdf').load()
+    second_loader = PDFLoader('cached.pdf')
+    assert second_loader.load() is first
+    assert second_loader.load() is first
+    mock_open.assert_called_once_with('cached.pdf')
+    logging.info("PDFLoader: Cached PDF loading test passed.")
 
-# DOCXLoader Tests
-def test_docx_loader_valid_file():
-    docx_loader = DOCXLoader(docx_path)
-    try:
-        docx_loader.validate_extension()
-        logging.info("DOCXLoader: Valid DOCX file test passed.")
-    except ValueError:
-        pytest.fail("DOCXLoader: File validation failed for a valid DOCX file.")
+def test_pdf_loader_extract_tables_sample():
+    loader = PDFLoader(pdf_path)
+    loader.load()
+    assert loader.extract_tables() == [
+        {"page_number": 1, "table": [['A', 'B'], ['10', '78'], ['11', '90'], ['12', '23']]}
+    ]
+    logging.info("PDFLoader: Sample table extraction test passed.")
 
-def test_docx_loader_load_method(mocker):
-    docx_loader = DOCXLoader(docx_path)
-    mock_open = mocker.patch('docx.Document', return_value=MagicMock())
-    assert docx_loader.load() is not None, "DOCXLoader: Failed to load a valid DOCX."
-    logging.info("DOCXLoader: DOCX loading test passed.")
-    mock_open.assert_called_once_with(docx_path)
+# Table pages as reported by the original pdfplumber extraction; pages PyMuPDF's table finder
+# does not handle (column layouts, rotated pages, spanning cells) are read with pdfplumber.
+@pytest.mark.parametrize("file_name,expected_pages", [
+    ('India.pdf', list(range(1, 22)) + list(range(21, 37))),
+    ('multi_column.pdf', [1]),
+    ('multicolumn.pdf', [3, 3]),
+    ('rotated.pdf', [1]),
+])
+def test_pdf_loader_extract_tables_pages(file_name, expected_pages):
+    loader = PDFLoader(os.path.join(documents_dir, file_name))
+    loader.load()
+    assert [table["page_number"] for table in loader.extract_tables()] == expected_pages
+    logging.info(f"PDFLoader: {file_name} table pages test passed.")
 
-# PPTLoader Tests
-def test_ppt_loader_valid_file():
-    ppt_loader = PPTLoader(pptx_path)
-    try:
-        ppt_loader.validate_extension()
-        logging.info("PPTLoader: Valid PPTX file test passed.")
-    except ValueError:
-        pytest.fail("PPTLoader: File validation failed for a valid PPTX file.")
+def test_pdf_loader_extract_tables_rotated_keeps_line_breaks():
+    loader = PDFLoader(os.path.join(documents_dir, 'rotated.pdf'))
+    loader.load()
+    assert loader.extract_tables() == [{"page_number": 1, "table": [
+        ['3', '2', '1', 'ID'],
+        ['Sam\nBrown', 'Jane\nSmith', 'John\nDoe', 'Name'],
+        ['22', '34', '28', 'Age'],
+        ['Sydney', 'London', 'New\nYork', 'City'],
+    ]}]
+    logging.info("PDFLoader: Rotated table extraction test passed.")
+
+def test_docx_loader_extract_links_sample():
+    loader = DOCXLoader(docx_path)
+    loader.load()
+    # The link is a HYPERLINK field with a \l text-fragment anchor, which is percent-encoded
+    assert loader.extract_links() == [{
+        "url": "https://www.w3schools.com/python/python_iterators.asp"
+               "#:~:text=An%20iterator%20is%20an%20object,)%20and%20__next__()%20",
+        "style": None
+    }]
+    logging.info("DOCXLoader: Sample link extraction test passed.")
+
+@pytest.mark.parametrize("loader_class,path,patch_target", [
+    (DOCXLoader, 'cached.docx', 'docx.Document'),
+    (PPTLoader, 'cached.pptx', 'file_loaders.Presentation'),
+])
+def test_loader_load_is_cached(loader_class, path, patch_target, mocker):
+    mock_open = mocker.patch(patch_target, return_value=MagicMock())
+    first = loader_class(path).load()
+    assert loader_class(path).load() is first
+    mock_open.assert_called_once_with(path)
+    logging.info(f"{loader_class.__name__}: Cached loading test passed.")
 
-def test_ppt_loader_load_method(mocker):
-    ppt_loader = PPTLoader(pptx_path)
-    mock_open = mocker.patch('pptx.Presentation', return_value=MagicMock())
-    assert ppt_loader.load() is not None, "PPTLoader: Failed to load a valid PPTX."
-    logging.info("PPTLoader: PPTX loading test passed.")
-    mock_open.assert_called_once_with(pptx_path)
+def test_registry_get_loader_for_path(tmp_path):
+    registry = FileLoaderRegistry(str(tmp_path))
+    assert registry.get_loader_for_path('report.PDF') == (PDFLoader, os.path.join(str(tmp_path), "PDF"))
+    assert registry.get_loader_for_path('notes/slides.pptx')[0] is PPTLoader
+    assert registry.get_loader_for_path('README') is None
+    logging.info("FileLoaderRegistry: Extension lookup test passed.")
@@ -1,23 +1,12 @@
 import pytest
 import os
 import logging
-from unittest.mock import MagicMock
-import sys
-import os
-
-# Append the src directory to the system path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from file_loaders import PDFLoader, DOCXLoader, PPTLoader
-
-from data_extractor import DataExtractor
-from storage import FileStorage, MySQLStorage
+import zlib
+from unittest.mock import MagicMock, mock_open, patch
 
-# Sample PDF, DOCX, and PPTX paths
-pdf_path = '/home/shtlp_0103/Assignment_3/Documents/sample.pdf'
-docx_path = '/home/shtlp_0103/Assignment_3/Documents/sample.docx'
-pptx_path = '/home/shtlp_0103/Assignment_3/Documents/sample.pptx'
-output_folder = '/home/shtlp_0103/Assignment_3/Output'
+import storage
+from storage import (FileStorage, MySQLStorage, INSERT_TEXT_SQL, INSERT_IMAGE_SQL,
+                     INSERT_TABLE_SQL, INSERT_LINK_SQL)
 
 # Mock the database configuration for MySQLStorage
 db_config = {
@@ -27,39 +16,19 @@ db_config = {
                 'database': 'test_db',
             }
 
-# Set up logging to file and console
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
-
-from datetime import datetime
-log_filename = f'test_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
-file_handler = logging.FileHandler(log_filename, 'w')
-
-console_handler = logging.StreamHandler()
-
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-file_handler.setFormatter(formatter)
-console_handler.setFormatter(formatter)
-
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
-logger.setLevel(logging.DEBUG)
-
 @pytest.fixture
 def file_storage(tmp_path):
     # Create a FileStorage instance with a temporary directory
-    return FileStorage(str(tmp_path))
+    storage = FileStorage(str(tmp_path))
+    yield storage
+    storage.close()
 
-def test_file_storage_save_text(file_storage, mocker):
-    text_data = [{'page_number': 1, 'text': 'Sample text'}]
-    
-    # Mock open function to test save_text
-    mock_open_function = mocker.patch('builtins.open', mock_open())
-    
-    file_storage.save_text(text_data)
-    
-    mock_open_function.assert_called_once_with(os.path.join(file_storage.output_directory, 'extracted_text.txt'), 'w')
-    mock_open_function().write.assert_called_once_with('Sample text\n')
+def test_file_storage_save_text(tmp_path):
+    storage = FileStorage(str(tmp_path))
+
+    storage.save_text([{"page_number": 1, "text": "Test text"}, {"page_number": 2, "text": "Café"}])
+
+    assert (tmp_path / 'extracted_text.txt').read_text(encoding='utf-8') == "Test text\nCafé\n"
     logging.info("FileStorage: Text saving test passed.")
 
 def test_file_storage_save_links(file_storage, mocker):
@@ -74,6 +43,14 @@ def test_file_storage_save_links(file_storage, mocker):
     mock_open_function().write.assert_called_once_with('Page 1 -> http://example.com\n')
     logging.info("FileStorage: Links saving test passed.")
 
+def test_file_storage_save_links_mixed_locations(tmp_path):
+    links_data = [{'url': 'http://a.com', 'slide_number': 2}, {'url': 'http://b.com', 'page_number': 3}, {'url': 'http://c.com'}]
+    
+    FileStorage(str(tmp_path)).save_links(links_data)
+    
+    assert (tmp_path / 'extracted_links.txt').read_text() == (
+        'Slide 2 -> http://a.com\nPage 3 -> http://b.com\n -> http://c.com\n')
+
 def test_file_storage_save_images(file_storage, mocker):
     images_data = [{'image_data': b'\x89PNG...', 'image_extension': 'png', 'page_number': 1}]
     
@@ -81,10 +58,34 @@ def test_file_storage_save_images(file_storage, mocker):
     mock_open_function = mocker.patch('builtins.open', mock_open())
     
     file_storage.save_images(images_data)
+    file_storage.flush()
     
     assert mock_open_function.call_count == 2  # Check that two files are being opened (image and metadata)
     logging.info("FileStorage: Images saving test passed.")
 
+def test_file_storage_close_writes_queued_images(tmp_path):
+    storage = FileStorage(str(tmp_path))
+    images_data = ({'image_data': bytes([i]), 'image_extension': 'png', 'page_number': i} for i in range(40))
+    
+    storage.save_images(images_data)
+    storage.close()
+    
+    assert (tmp_path / 'image_39.png').read_bytes() == bytes([39])
+    assert len(list(tmp_path.glob('image_*_metadata.txt'))) == 40
+    logging.info("FileStorage: Queued images written on close test passed.")
+
+def test_write_blob_falls_back_when_direct_write_fails(tmp_path, mocker):
+    path = str(tmp_path / 'image_0.bin')
+    data = b'\x01' * (storage.LARGE_BLOB_SIZE + 3)
+    # Fail every O_DIRECT write; the buffered fallback writes through the file object instead
+    mocker.patch('storage.os.write', side_effect=OSError(22, 'Invalid argument'))
+    
+    storage._write_blob(path, data)
+    
+    with open(path, 'rb') as blob_file:
+        assert blob_file.read() == data
+    logging.info("FileStorage: O_DIRECT fallback test passed.")
+
 def test_file_storage_save_tables(file_storage, mocker):
     tables_data = [{'table': [['Header1', 'Header2'], ['Row1Col1', 'Row1Col2']], 'page_number': 1}]
     
@@ -92,63 +93,155 @@ def test_file_storage_save_tables(file_storage, mocker):
     mock_open_function = mocker.patch('builtins.open', mock_open())
     
     file_storage.save_tables(tables_data)
+    file_storage.flush()
     
     assert mock_open_function.call_count == 2  # Check that two files are being opened (table and metadata)
     logging.info("FileStorage: Tables saving test passed.")
 
+def test_file_storage_save_tables_csv_content(tmp_path):
+    tables_data = [{'table': [['Header1', 'Header, 2'], ['Row1Col1', 'Row1Col2']], 'slide_number': 3}]
+    
+    storage = FileStorage(str(tmp_path))
+    storage.save_tables(tables_data)
+    storage.close()
+    
+    assert (tmp_path / 'table_0_location_3.csv').read_bytes() == b'Header1,"Header, 2"\nRow1Col1,Row1Col2\n'
+
 
 @pytest.fixture
-def mysql_storage(mocker):
-    # Mock MySQL connection
-    mock_connection = mocker.patch('mysql.connector.connect', return_value=MagicMock())
+def mock_pool(mocker):
+    # Mock the MySQL connection pool; each test starts without cached pools
+    mocker.patch.dict(MySQLStorage._pools, clear=True)
+    return mocker.patch('storage.MySQLConnectionPool', return_value=MagicMock())
+
+@pytest.fixture(scope="module")
+def mysql_pool():
+    # One mocked pool for the save tests of this module, as a real run shares one pool per process
+    with patch.dict(MySQLStorage._pools, clear=True), \
+            patch('storage.MySQLConnectionPool', return_value=MagicMock()) as pool_class:
+        yield pool_class
+
+@pytest.fixture(scope="module")
+def _module_mysql_storage(mysql_pool):
     storage = MySQLStorage(db_config)
     yield storage
     storage.close()
 
-def test_mysql_storage_save_text(mysql_storage, mocker):
+@pytest.fixture
+def mysql_storage(_module_mysql_storage, mysql_pool):
+    # Forget the calls of earlier tests, so each test can assert on the pooled cursor
+    mysql_pool.return_value.reset_mock()
+    return _module_mysql_storage
+
+def pooled_cursor(pool_class):
+    """The cursor every pooled connection of the mocked pool hands out."""
+    return pool_class.return_value.get_connection.return_value.cursor.return_value
+
+def test_mysql_storage_connect_options(mock_pool):
+    storage = MySQLStorage(db_config)
+    
+    assert mock_pool.call_args.kwargs['compress'] is True
+    assert mock_pool.call_args.kwargs['autocommit'] is False
+    assert mock_pool.call_args.kwargs['pool_size'] == 2  # one saving thread per process
+    connection = mock_pool.return_value.get_connection.return_value
+    connection.cursor.assert_called_with()  # plain cursor, so executemany sends multi-row INSERTs
+    connection.close.assert_called()  # returned to the pool
+    storage.close()
+    logging.info("MySQLStorage: Connection options test passed.")
+
+def test_mysql_storage_pool_is_shared(mock_pool):
+    MySQLStorage(db_config)
+    MySQLStorage(db_config)
+    
+    mock_pool.assert_called_once()
+    logging.info("MySQLStorage: Shared connection pool test passed.")
+
+def test_mysql_storage_pool_with_unhashable_config(mock_pool):
+    config = {**db_config, 'ssl_disabled': False, 'client_flags': [2048]}
+    
+    MySQLStorage(config, pool_size=1)
+    MySQLStorage(dict(config))
+    
+    mock_pool.assert_called_once()
+    assert mock_pool.call_args.kwargs['pool_size'] == 1
+    logging.info("MySQLStorage: Unhashable configuration pool test passed.")
+
+def test_mysql_storage_save_text(mysql_storage, mysql_pool):
     text_data = [{'page_number': 1, 'text': 'Sample text'}]
-    mock_cursor = mysql_storage.cursor
-    mock_cursor.execute = MagicMock()
+    mock_cursor = pooled_cursor(mysql_pool)
     
     mysql_storage.save_text(text_data)
     
-    mock_cursor.execute.assert_called_once_with('''
-        INSERT INTO text_data (content, page_number) VALUES (%s, %s)
-    ''', ('Sample text', None))
+    mock_cursor.executemany.assert_called_once()
+    sql, records = mock_cursor.executemany.call_args.args
+    assert sql == INSERT_TEXT_SQL
+    assert records == [('Sample text', None)]
     logging.info("MySQLStorage: Text saving to MySQL test passed.")
 
-def test_mysql_storage_save_images(mysql_storage, mocker):
+def test_mysql_storage_save_images(mysql_storage, mysql_pool):
     images_data = [{'image_data': b'\x89PNG...', 'image_extension': 'png', 'page_number': 1}]
-    mock_cursor = mysql_storage.cursor
-    mock_cursor.execute = MagicMock()
+    mock_cursor = pooled_cursor(mysql_pool)
     
     mysql_storage.save_images(images_data)
     
-    mock_cursor.execute.assert_called_once_with('''
-        INSERT INTO images_data (image_data, image_extension, page_number) VALUES (%s, %s, %s)
-    ''', (b'\x89PNG...', 'png', 1))
+    mock_cursor.executemany.assert_called_once()
+    sql, records = mock_cursor.executemany.call_args.args
+    assert sql == INSERT_IMAGE_SQL
+    assert records == [(b'\x89PNG...', 'png', 1, 0)]
     logging.info("MySQLStorage: Images saving to MySQL test passed.")
 
-def test_mysql_storage_save_tables(mysql_storage, mocker):
+def test_mysql_storage_save_images_compresses_raw_formats(mysql_storage, mysql_pool):
+    images_data = [{'image_data': b'BM' + bytes(1000), 'image_extension': 'bmp', 'page_number': 1}]
+    mock_cursor = pooled_cursor(mysql_pool)
+    
+    mysql_storage.save_images(images_data)
+    
+    (image_data, extension, page_number, compressed), = mock_cursor.executemany.call_args.args[1]
+    assert compressed == 1
+    assert zlib.decompress(image_data) == b'BM' + bytes(1000)
+    logging.info("MySQLStorage: Compressed images saving to MySQL test passed.")
+
+def test_mysql_storage_save_images_in_batches(mysql_storage, mysql_pool):
+    images_data = [{'image_data': b'\x89PNG...', 'image_extension': 'png', 'page_number': 1}] * 501
+    mock_cursor = pooled_cursor(mysql_pool)
+    
+    mysql_storage.save_images(images_data)
+    
+    assert mock_cursor.executemany.call_count == 2
+    assert len(mock_cursor.executemany.call_args_list[0].args[1]) == 500
+    assert len(mock_cursor.executemany.call_args_list[1].args[1]) == 1
+    logging.info("MySQLStorage: Batched images saving to MySQL test passed.")
+
+def test_mysql_storage_save_images_from_generator(mysql_storage, mysql_pool):
+    images_data = ({'image_data': b'\x89PNG...', 'image_extension': 'png', 'page_number': i} for i in range(3))
+    mock_cursor = pooled_cursor(mysql_pool)
+    
+    mysql_storage.save_images(images_data)
+    
+    mock_cursor.executemany.assert_called_once()
+    assert [record[2] for record in mock_cursor.executemany.call_args.args[1]] == [0, 1, 2]
+    logging.info("MySQLStorage: Streamed images saving to MySQL test passed.")
+
+def test_mysql_storage_save_tables(mysql_storage, mysql_pool):
     tables_data = [{'table': [['Header1', 'Header2'], ['Row1Col1', 'Row1Col2']], 'page_number': 1}]
-    mock_cursor = mysql_storage.cursor
-    mock_cursor.execute = MagicMock()
+    mock_cursor = pooled_cursor(mysql_pool)
     
     mysql_storage.save_tables(tables_data)
     
-    mock_cursor.execute.assert_called_once_with('''
-        INSERT INTO tables_data (table_data, page_number) VALUES (%s, %s)
-    ''', ("[['Header1', 'Header2'], ['Row1Col1', 'Row1Col2']]", None))
+    mock_cursor.executemany.assert_called_once()
+    sql, records = mock_cursor.executemany.call_args.args
+    assert sql == INSERT_TABLE_SQL
+    assert records == [('[["Header1","Header2"],["Row1Col1","Row1Col2"]]', 1)]
     logging.info("MySQLStorage: Tables saving to MySQL test passed.")
 
-def test_mysql_storage_save_links(mysql_storage, mocker):
+def test_mysql_storage_save_links(mysql_storage, mysql_pool):
     links_data = [{'url': 'http://example.com', 'page_number': 1}]
-    mock_cursor = mysql_storage.cursor
-    mock_cursor.execute = MagicMock()
+    mock_cursor = pooled_cursor(mysql_pool)
     
     mysql_storage.save_links(links_data)
     
-    mock_cursor.execute.assert_called_once_with('''
-        INSERT INTO links_data (url, page_number) VALUES (%s, %s)
-    ''', ('http://example.com', None))
-    logging.info("MySQLStorage: Links saving to MySQL test passed.")
\ No newline at end of file
+    mock_cursor.executemany.assert_called_once()
+    sql, records = mock_cursor.executemany.call_args.args
+    assert sql == INSERT_LINK_SQL
+    assert records == [('http://example.com', 1)]
+    logging.info("MySQLStorage: Links saving to MySQL test passed.")
@@ -1,15 +1,14 @@
 from abc import ABC, abstractmethod
-import fitz
-import docx
-from pptx import Presentation
 import os
 import csv
-import pdfplumber
 import mysql.connector
 import shutil  # To delete directories
 from dotenv import load_dotenv
 import json
 
+# Ruled-line detection for the pdfplumber fallback, passed explicitly rather than relying on defaults
+PLUMBER_TABLE_SETTINGS = {"vertical_strategy": "lines", "horizontal_strategy": "lines"}
+
 class FileLoader(ABC):
     def __init__(self, file_path, expected_extension):
         self.file_path = file_path
@@ -31,6 +30,8 @@ class PDFLoader(FileLoader):
         self.doc = None
 
     def load(self):
+        import fitz  # parsers are imported on first load, not when the module is imported
+
         self.validate_extension()
         self.doc = fitz.open(self.file_path)
         return self.doc
@@ -42,6 +43,8 @@ class DOCXLoader(FileLoader):
         self.doc = None
 
     def load(self):
+        import docx
+
         self.validate_extension()
         self.doc = docx.Document(self.file_path)
         return self.doc
@@ -53,6 +56,8 @@ class PPTLoader(FileLoader):
         self.presentation = None
 
     def load(self):
+        from pptx import Presentation
+
         self.validate_extension()
         self.presentation = Presentation(self.file_path)
         return self.presentation
@@ -62,24 +67,42 @@ class DataExtractor:
         self.file_loader = file_loader
         self.file_loader.load()
 
+        # Resolve the extraction methods for the loader's type once, instead of on every extract_* call
+        extractors = {
+            PDFLoader: (self._extract_pdf_text, self._extract_pdf_links,
+                        self._extract_pdf_images, self._extract_pdf_tables),
+            DOCXLoader: (self._extract_docx_text, self._extract_docx_links,
+                         self._extract_docx_images, self._extract_docx_tables),
+            PPTLoader: (self._extract_ppt_text, self._extract_ppt_links,
+                        self._extract_ppt_images, self._extract_ppt_tables),
+        }.get(type(file_loader))
+        if extractors is None:
+            raise ValueError("Unsupported file type for extraction.")
+        self._text_fn, self._links_fn, self._images_fn, self._tables_fn = extractors
+        self._plumber = None  # pdfplumber handle, opened on first use by _plumber_doc()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the pdfplumber handle, if one was opened."""
+        if self._plumber is not None:
+            self._plumber.close()
+            self._plumber = None
+
     def extract_text(self):
         """Extracts text with metadata like page number and font details."""
-        if isinstance(self.file_loader, PDFLoader):
-            return self._extract_pdf_text()
-        elif isinstance(self.file_loader, DOCXLoader):
-            return self._extract_docx_text()
-        elif isinstance(self.file_loader, PPTLoader):
-            return self._extract_ppt_text()
-        else:
-            raise ValueError("Unsupported file type for text extraction.")
+        return self._text_fn()
 
     def _extract_pdf_text(self):
         text_data = []
-        for page_num in range(len(self.file_loader.doc)):
-            page = self.file_loader.doc.load_page(page_num)
+        for page_number, page in enumerate(self.file_loader.doc, start=1):
             text = page.get_text("text")
             text_data.append({
-                "page_number": page_num + 1,
+                "page_number": page_number,
                 "text": text
             })
         return text_data
@@ -96,49 +119,39 @@ class DataExtractor:
     def _extract_ppt_text(self):
         text_data = []
         for slide_num, slide in enumerate(self.file_loader.presentation.slides):
-            slide_text = []
-            for shape in slide.shapes:
-                if hasattr(shape, "text"):
-                    slide_text.append(shape.text)
-            
-            # Join the slide text list into a single string separated by newlines
+            # Join the slide text into a single string separated by newlines; shape.text is read once per shape
             text_data.append({
                 "slide_number": slide_num + 1,
-                "text": "\n".join(slide_text)  # Join text list into a single string
+                "text": "\n".join(
+                    text for shape in slide.shapes if (text := getattr(shape, "text", None)) is not None)
             })
         return text_data
 
     def extract_links(self):
         """Extracts hyperlinks with metadata."""
-        if isinstance(self.file_loader, PDFLoader):
-            return self._extract_pdf_links()
-        elif isinstance(self.file_loader, DOCXLoader):
-            return self._extract_docx_links()
-        elif isinstance(self.file_loader, PPTLoader):
-            return self._extract_ppt_links()
-        else:
-            raise ValueError("Unsupported file type for link extraction.")
+        return self._links_fn()
 
     def _extract_pdf_links(self):
-        link_data = []
-        for page_num in range(len(self.file_loader.doc)):
-            page = self.file_loader.doc.load_page(page_num)
-            links = page.get_links()
-            for link in links:
-                link_data.append({
-                    "page_number": page_num + 1,
-                    "url": link.get('uri')
-                })
-        return link_data
+        # Only URI links have a URL; internal goto and launch links are skipped
+        return [
+            {"page_number": page_number, "url": uri}
+            for page_number, page in enumerate(self.file_loader.doc, start=1)
+            for link in page.get_links()
+            if (uri := link.get('uri'))
+        ]
 
     def _extract_docx_links(self):
         link_data = []
+        rels = self.file_loader.doc.part.rels
         for para_num, para in enumerate(self.file_loader.doc.paragraphs):
-            for run in para.runs:
-                if run.font.color and run.text.startswith('http'):
+            # Hyperlinks are w:hyperlink elements whose r:id names an external relationship holding the URL;
+            # internal bookmarks (w:anchor) have no r:id and are skipped
+            for r_id in para._p.xpath('./w:hyperlink/@r:id'):
+                rel = rels.get(r_id)
+                if rel is not None and rel.is_external:
                     link_data.append({
                         "paragraph_number": para_num + 1,  # Add paragraph number
-                        "url": run.text,
+                        "url": rel.target_ref,
                         "style": para.style.name
                     })
         return link_data
@@ -146,41 +159,37 @@ class DataExtractor:
 
     def _extract_ppt_links(self):
         link_data = []
-        for slide_num, slide in enumerate(self.file_loader.presentation.slides):
+        for slide_number, slide in enumerate(self.file_loader.presentation.slides, start=1):
             for shape in slide.shapes:
                 # Check if the shape contains text and has a hyperlink attribute
                 if shape.has_text_frame:
                     for paragraph in shape.text_frame.paragraphs:
                         for run in paragraph.runs:
-                            if run.hyperlink and run.hyperlink.address:
+                            # run.hyperlink builds a new proxy on every access, so read it once
+                            address = run.hyperlink.address
+                            if address:
                                 link_data.append({
-                                    "slide_number": slide_num + 1,
-                                    "url": run.hyperlink.address
+                                    "slide_number": slide_number,
+                                    "url": address
                                 })
                 # In case the shape has a hyperlink directly (without being in the text frame)
-                elif hasattr(shape, "hyperlink") and shape.hyperlink.address:
-                    link_data.append({
-                        "slide_number": slide_num + 1,
-                        "url": shape.hyperlink.address
-                    })
+                else:
+                    hyperlink = getattr(shape, "hyperlink", None)
+                    if hyperlink is not None and hyperlink.address:
+                        link_data.append({
+                            "slide_number": slide_number,
+                            "url": hyperlink.address
+                        })
         return link_data
 
 
     def extract_images(self):
         """Extract images from the document."""
-        if isinstance(self.file_loader, PDFLoader):
-            return self._extract_pdf_images()
-        elif isinstance(self.file_loader, DOCXLoader):
-            return self._extract_docx_images()
-        elif isinstance(self.file_loader, PPTLoader):
-            return self._extract_ppt_images()
-        else:
-            raise ValueError("Unsupported file type for image extraction.")
+        return self._images_fn()
 
     def _extract_pdf_images(self):
         image_data = []
-        for page_num in range(len(self.file_loader.doc)):
-            page = self.file_loader.doc.load_page(page_num)
+        for page_number, page in enumerate(self.file_loader.doc, start=1):
             images = page.get_images(full=True)
             for img_index, img in enumerate(images):
                 xref = img[0]
@@ -188,7 +197,7 @@ class DataExtractor:
                 img_bytes = image["image"]
                 img_extension = image["ext"]
                 image_data.append({
-                    "page_number": page_num + 1,
+                    "page_number": page_number,
                     "image_data": img_bytes,
                     "image_extension": img_extension
                 })
@@ -205,12 +214,15 @@ class DataExtractor:
         return image_data
 
     def _extract_ppt_images(self):
+        from pptx.enum.shapes import MSO_SHAPE_TYPE
+
         image_data = []
         for slide_num, slide in enumerate(self.file_loader.presentation.slides):
             for shape in slide.shapes:
-                if hasattr(shape, "image"):
-                    img_bytes = shape.image.blob
-                    image_extension = shape.image.content_type.split('/')[-1]
+                if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+                    image = shape.image
+                    img_bytes = image.blob
+                    image_extension = image.ext
                     image_data.append({
                         "slide_number": slide_num + 1,
                         "image_data": img_bytes,
@@ -220,56 +232,60 @@ class DataExtractor:
 
     def extract_tables(self):
         """Extract tables from the document."""
-        if isinstance(self.file_loader, PDFLoader):
-            return self._extract_pdf_tables_with_plumber()  # Using 
-        elif isinstance(self.file_loader, DOCXLoader):
-            return self._extract_docx_tables()
-        elif isinstance(self.file_loader, PPTLoader):
-            return self._extract_ppt_tables()  
-        else:
-            raise ValueError("Unsupported file type for table extraction.")
+        return self._tables_fn()
+
+    def _extract_pdf_tables(self):
+        """Extract tables from PDF using PyMuPDF's table finder on the already loaded document."""
+        import fitz  # already imported by PDFLoader.load()
+
+        if not hasattr(fitz.Page, "find_tables"):
+            # PyMuPDF builds older than 1.23 have no table finder
+            return self._extract_pdf_tables_with_plumber()
+        table_data = []
+        for page_number, page in enumerate(self.file_loader.doc, start=1):
+            for table in page.find_tables().tables:
+                table_data.append({
+                    "page_number": page_number,
+                    "table": table.extract()
+                })
+        return table_data
+
+    def _plumber_doc(self):
+        """Open the PDF with pdfplumber on first use and keep the handle for later calls; see close()."""
+        if self._plumber is None:
+            import pdfplumber
+
+            self._plumber = pdfplumber.open(self.file_loader.file_path)
+        return self._plumber
 
     def _extract_pdf_tables_with_plumber(self):
         """Extract tables from PDF using pdfplumber."""
         table_data = []
-        with pdfplumber.open(self.file_loader.file_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                tables = page.extract_tables()  # Extract tables from each page
-                for table in tables:
-                    table_data.append({
-                        "page_number": page_num + 1,
-                        "table": table
-                    })
+        pdf = self._plumber_doc()
+        for page_num, page in enumerate(pdf.pages):
+            # Find the table regions first and read only their cells
+            for table in page.find_tables(table_settings=PLUMBER_TABLE_SETTINGS):
+                table_data.append({
+                    "page_number": page_num + 1,
+                    "table": table.extract()
+                })
         return table_data
     
     def _extract_docx_tables(self):
-        table_data = []
-        for table in self.file_loader.doc.tables:
-            table_rows = []
-            for row in table.rows:
-                row_data = []
-                for cell in row.cells:
-                    row_data.append(cell.text)
-                table_rows.append(row_data)
-            table_data.append({
-                "table": table_rows
-            })
-        return table_data
+        return [
+            {"table": [[cell.text for cell in row.cells] for row in table.rows]}
+            for table in self.file_loader.doc.tables
+        ]
 
     def _extract_ppt_tables(self):
-        table_data = []
-        for slide_num, slide in enumerate(self.file_loader.presentation.slides):
-            for shape in slide.shapes:
-                if shape.has_table:
-                    table_rows = []
-                    for row in shape.table.rows:
-                        row_data = [cell.text for cell in row.cells]
-                        table_rows.append(row_data)
-                    table_data.append({
-                        "slide_number": slide_num + 1,
-                        "table": table_rows
-                    })
-        return table_data
+        return [
+            {
+                "slide_number": slide_num + 1,
+                "table": [[cell.text for cell in row.cells] for row in shape.table.rows]
+            }
+            for slide_num, slide in enumerate(self.file_loader.presentation.slides)
+            for shape in slide.shapes if shape.has_table
+        ]
 
 class Storage(ABC):
     """Abstract class for storing extracted data."""
@@ -499,13 +515,12 @@ class Processing:
 
         # Initialize the loader and extractor
         loader = loader_class(file_path)
-        extractor = DataExtractor(loader)
-
-        # Extract data
-        text_data = extractor.extract_text()
-        link_data = extractor.extract_links()
-        images_data = extractor.extract_images()
-        tables_data = extractor.extract_tables()
+        with DataExtractor(loader) as extractor:
+            # Extract data
+            text_data = extractor.extract_text()
+            link_data = extractor.extract_links()
+            images_data = extractor.extract_images()
+            tables_data = extractor.extract_tables()
 
         # Save data to file storage
         file_storage = FileStorage(output_folder)
@@ -2,9 +2,6 @@ import random
 from pptx import Presentation
 from pptx.util import Inches
 
-# Create a presentation object
-presentation = Presentation()
-
 # Example list of random hyperlinks, titles, and body texts
 titles = [
     "Python Overview", "Data Science", "Machine Learning", "Artificial Intelligence",
@@ -29,61 +26,65 @@ link_texts = [
     "Android Development", "Unreal Engine"
 ]
 
-# Add random slides
-for i in range(50):
+# Shape positions and sizes, converted to EMU once instead of for every slide
+BODY_BOX = (Inches(1), Inches(2), Inches(6), Inches(1))  # left, top, width, height
+TABLE_BOX = (Inches(1), Inches(3), Inches(5), Inches(1))
+IMAGE_LEFT, IMAGE_TOP, IMAGE_HEIGHT = Inches(1), Inches(2), Inches(3)
+
+
+def main():
+    """Create the sample presentation with 50 randomly filled slides."""
+    # Create a presentation object
+    presentation = Presentation()
     slide_layout = presentation.slide_layouts[5]  # Use blank layout for simplicity
-    slide = presentation.slides.add_slide(slide_layout)
 
-    # Random title and body text
-    title_text = random.choice(titles)
-    body_text = random.choice(body_texts)
+    # Add random slides
+    for i in range(50):
+        slide = presentation.slides.add_slide(slide_layout)
+
+        # Random title and body text
+        title_text = random.choice(titles)
+        body_text = random.choice(body_texts)
     
-    # Add Title
-    title = slide.shapes.title
-    title.text = f"Slide {i+1}: {title_text}"
+        # Add Title
+        title = slide.shapes.title
+        title.text = f"Slide {i+1}: {title_text}"
+
+        # Add Body Text
+        textbox = slide.shapes.add_textbox(*BODY_BOX)
+        text_frame = textbox.text_frame
+        text_frame.text = body_text
+
+        # Randomly add hyperlinks to some slides
+        if random.choice([True, False]):  # 50% chance to add a hyperlink
+            link = random.choice(links)
+            link_text = random.choice(link_texts)
+            p = text_frame.add_paragraph()
+            run = p.add_run()
+            run.text = f"Click here to visit {link_text}"
+            run.hyperlink.address = link
 
-    # Add Body Text
-    left = Inches(1)
-    top = Inches(2)
-    width = Inches(6)
-    height = Inches(1)
-    textbox = slide.shapes.add_textbox(left, top, width, height)
-    text_frame = textbox.text_frame
-    text_frame.text = body_text
+        # Randomly add a table to some slides
+        if random.choice([True, False]):  # 50% chance to add a table
+            rows = 2
+            cols = 2
+            table = slide.shapes.add_table(rows, cols, *TABLE_BOX).table
 
-    # Randomly add hyperlinks to some slides
-    if random.choice([True, False]):  # 50% chance to add a hyperlink
-        link = random.choice(links)
-        link_text = random.choice(link_texts)
-        p = text_frame.add_paragraph()
-        run = p.add_run()
-        run.text = f"Click here to visit {link_text}"
-        run.hyperlink.address = link
+            # Set table content
+            table.cell(0, 0).text = 'Header 1'
+            table.cell(0, 1).text = 'Header 2'
+            table.cell(1, 0).text = 'Content 1'
+            table.cell(1, 1).text = 'Content 2'
 
-    # Randomly add a table to some slides
-    if random.choice([True, False]):  # 50% chance to add a table
-        rows = 2
-        cols = 2
-        left = Inches(1)
-        top = Inches(3)
-        width = Inches(5)
-        height = Inches(1)
-        table = slide.shapes.add_table(rows, cols, left, top, width, height).table
+        # Randomly add images to some slides
+        if random.choice([True, False]):  # 50% chance to add an image
+            img_path = "/home/shtlp_0103/Assignment_3/Documents/apple.jpeg"  # Replace with valid path
+            slide.shapes.add_picture(img_path, IMAGE_LEFT, IMAGE_TOP, height=IMAGE_HEIGHT)
 
-        # Set table content
-        table.cell(0, 0).text = 'Header 1'
-        table.cell(0, 1).text = 'Header 2'
-        table.cell(1, 0).text = 'Content 1'
-        table.cell(1, 1).text = 'Content 2'
+    # Save the presentation
+    presentation.save('large.pptx')
+    print("Presentation with 50+ slides created successfully!")
 
-    # Randomly add images to some slides
-    if random.choice([True, False]):  # 50% chance to add an image
-        img_path = "/home/shtlp_0103/Assignment_3/Documents/apple.jpeg"  # Replace with valid path
-        left = Inches(1)
-        top = Inches(2)
-        height = Inches(3)
-        slide.shapes.add_picture(img_path, left, top, height=height)
 
-# Save the presentation
-presentation.save('large.pptx')
-print("Presentation with 50+ slides created successfully!")
+if __name__ == "__main__":
+    main()
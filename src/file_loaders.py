@@ -1,20 +1,254 @@
 from abc import ABC, abstractmethod
 import fitz
 import docx
+from docx.enum.style import WD_STYLE_TYPE
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml.ns import qn as docx_qn
 from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.oxml.ns import qn as pptx_qn
 import os
+import re
 import csv
+import functools
+import multiprocessing
+import logging
+from collections import OrderedDict
+from urllib.parse import quote
+
+# Parsed documents kept per file type, so re-processing an unchanged file skips the parse.
+DOCUMENT_CACHE_SIZE = 16
+
+# PDFs with fewer pages than this are extracted in-process; the pool startup cost outweighs the gain.
+MIN_PARALLEL_PAGES = 4
+
+# Extracted PDF images kept for reuse by later pages of the same extraction; small, so streaming
+# images stays memory-bounded.
+PDF_IMAGE_CACHE_SIZE = 16
+
+# Structured text extraction flags: the default "dict" flags without image blocks, whose
+# pixel data is not needed for text and is extracted separately.
+PDF_TEXT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+# WordprocessingML / DrawingML tags read directly when collecting paragraph and table cell text and field codes.
+_DOCX_P = docx_qn('w:p')
+_DOCX_T = docx_qn('w:t')
+_DOCX_INSTR_TEXT = docx_qn('w:instrText')
+_DOCX_FLD_CHAR = docx_qn('w:fldChar')
+_DOCX_FLD_CHAR_TYPE = docx_qn('w:fldCharType')
+_DOCX_FLD_SIMPLE = docx_qn('w:fldSimple')
+_DOCX_INSTR = docx_qn('w:instr')
+_PPTX_P = pptx_qn('a:p')
+_PPTX_T = pptx_qn('a:t')
+
+# URL and optional \l anchor of a Word HYPERLINK field code, e.g. HYPERLINK "https://a.org" \l "top".
+_DOCX_HYPERLINK_FIELD = re.compile(r'HYPERLINK\s+"([^"]*)"(?:.*?\\l\s+"([^"]*)")?')
+
+# Characters left as they are when percent-encoding a HYPERLINK anchor, so text fragments
+# such as #:~:text=start,end keep their syntax.
+_DOCX_ANCHOR_SAFE = ":~=,()&"
+
+# Document (or the error raised while opening it) set once per pool process by _init_pdf_worker,
+# and the worker's cache of extracted images (see _pdf_page_images).
+_worker_doc = None
+_worker_error = None
+_worker_images = None
+
+
+def file_mtime(file_path):
+    """Return the file's modification time in ns, used to invalidate cached documents, or None if it cannot be read."""
+    try:
+        return os.stat(file_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def file_extension(file_path):
+    """Return the file's extension in lowercase and without the dot, e.g. 'pdf', or '' if it has none."""
+    return os.path.splitext(file_path)[1][1:].lower()
+
+
+@functools.lru_cache(maxsize=DOCUMENT_CACHE_SIZE)
+def _open_pdf(file_path, mtime):
+    """Open a PDF with PyMuPDF. Cached per (path, mtime) so re-processing an unchanged file skips the parse."""
+    return fitz.open(file_path)
+
+
+@functools.lru_cache(maxsize=DOCUMENT_CACHE_SIZE)
+def _open_docx(file_path, mtime):
+    """Open a DOCX with python-docx. Cached per (path, mtime) like _open_pdf; extraction only reads it."""
+    return docx.Document(file_path)
+
+
+@functools.lru_cache(maxsize=DOCUMENT_CACHE_SIZE)
+def _open_pptx(file_path, mtime):
+    """Open a PPTX with python-pptx. Cached per (path, mtime) like _open_pdf; extraction only reads it."""
+    return Presentation(file_path)
+
+
+@functools.lru_cache(maxsize=1)
+def _open_plumber(file_path, pid):
+    """
+    Open a PDF with pdfplumber, for the pages whose tables are read with it (see _pdf_page_tables).
+
+    Keyed by process id as well, since an open file must not be shared with forked pool workers.
+    """
+    import pdfplumber  # imported on first use; most ruled tables never need it
+
+    return pdfplumber.open(file_path)
+
+
+def _init_pdf_worker(opener, file_path):
+    """
+    Pool initializer: opens the PDF once per worker process.
+
+    Errors are kept and re-raised from the tasks; an exception escaping a Pool
+    initializer makes the pool restart its workers forever.
+    """
+    global _worker_doc, _worker_error, _worker_images
+    _worker_images = OrderedDict()
+    try:
+        _worker_doc = opener(file_path)
+    except Exception as e:
+        _worker_error = e
+
+
+def _pdf_page_worker(args):
+    """Pool task: runs a page extraction function against the worker's own document."""
+    if _worker_error is not None:
+        raise _worker_error
+    page_func, page_num = args
+    return page_func(_worker_doc, _worker_doc.load_page(page_num), page_num)
+
+
+def _docx_field_codes(body):
+    """
+    Yields the instruction of every field in a DOCX body, e.g. ' HYPERLINK "https://a.org" '.
+
+    A complex field's instruction runs from its begin to its separate (or end) w:fldChar and may
+    be split over several runs, so its w:instrText pieces are joined first; fields can be nested.
+    Simple fields keep the instruction in the w:instr attribute of w:fldSimple.
+    """
+    open_fields = []  # instruction pieces of each open complex field; None once past its separate
+    for element in body.iter(_DOCX_FLD_CHAR, _DOCX_INSTR_TEXT, _DOCX_FLD_SIMPLE):
+        if element.tag == _DOCX_INSTR_TEXT:
+            if open_fields and open_fields[-1] is not None:
+                open_fields[-1].append(element.text or "")
+        elif element.tag == _DOCX_FLD_SIMPLE:
+            yield element.get(_DOCX_INSTR, "")
+        else:
+            char_type = element.get(_DOCX_FLD_CHAR_TYPE)
+            if char_type == "begin":
+                open_fields.append([])
+            elif open_fields and char_type in ("separate", "end"):
+                pieces = open_fields.pop() if char_type == "end" else open_fields[-1]
+                if pieces is not None:
+                    yield "".join(pieces)
+                if char_type == "separate":
+                    open_fields[-1] = None
+
+
+def _docx_cell_text(cell):
+    """Returns the text of a DOCX table cell from its w:t nodes, one line per paragraph."""
+    return "\n".join("".join(t.text or "" for t in p.iter(_DOCX_T)) for p in cell._tc.iterchildren(_DOCX_P))
+
+
+def _ppt_cell_text(cell):
+    """Returns the text of a PPTX table cell from its a:t nodes, one line per paragraph."""
+    return "\n".join("".join(t.text or "" for t in p.iter(_PPTX_T)) for p in cell._tc.iter(_PPTX_P))
+
+
+# Page extraction functions. Each receives the document, one of its loaded pages and the
+# 0-based page index, and returns the list of records found on that page.
+
+def _pdf_page_text(doc, page, page_num):
+    """Extracts the text of a PDF page and the fonts it uses from a single structured text pass."""
+    lines = []
+    fonts = {}
+    for block in page.get_text("dict", flags=PDF_TEXT_FLAGS)["blocks"]:
+        for line in block.get("lines", ()):
+            spans = line["spans"]
+            lines.append("".join(span["text"] for span in spans))
+            for span in spans:
+                fonts.setdefault(span["font"], None)
+    return [{
+        "page_number": page_num + 1,
+        "text": "".join(f"{line}\n" for line in lines),
+        "fonts": list(fonts)
+    }]
+
+
+def _pdf_page_links(doc, page, page_num):
+    """Extracts the hyperlinks (URI links) of a PDF page; internal goto and launch links have no URL and are skipped."""
+    return [{"page_number": page_num + 1, "url": uri} for link in page.get_links() if (uri := link.get('uri'))]
+
+
+def _pdf_page_images(doc, page, page_num, seen=None):
+    """
+    Extracts the images of a PDF page.
+
+    `seen` is an OrderedDict mapping xrefs to the (image bytes, extension) already extracted from
+    the same document, as logos and headers reuse one xref on many pages; it keeps the
+    PDF_IMAGE_CACHE_SIZE most recently used images. None uses the pool worker's own cache, so in
+    a pool images are reused across the pages of one worker.
+    """
+    if seen is None:
+        seen = _worker_images if _worker_images is not None else OrderedDict()
+    image_data = []
+    for img in page.get_images():
+        xref = img[0]
+        image = seen.get(xref)
+        if image is None:
+            extracted = doc.extract_image(xref)
+            image = seen[xref] = (extracted["image"], extracted["ext"])
+            if len(seen) > PDF_IMAGE_CACHE_SIZE:
+                seen.popitem(last=False)
+        else:
+            seen.move_to_end(xref)
+        image_bytes, image_extension = image
+        image_data.append({
+            "page_number": page_num + 1,
+            "image_data": image_bytes,
+            "image_extension": image_extension
+        })
+    return image_data
+
+
+def _pdf_page_tables(doc, page, page_num):
+    """
+    Extracts the tables of a PDF page with PyMuPDF's table finder.
+
+    The finder only reports ruled tables, so pages are read with pdfplumber instead when it finds
+    none (text laid out in columns), when the page is rotated (it drops the line breaks inside
+    cells) or when a table has spanning (None) cells, which it often splits out of an enclosing table.
+    """
+    tables = [table.extract() for table in page.find_tables().tables]
+    if not tables or page.rotation or any(cell is None for table in tables for row in table for cell in row):
+        plumber_page = _open_plumber(doc.name, os.getpid()).pages[page_num]
+        tables = plumber_page.extract_tables()
+        plumber_page.close()  # drop the page's parsed characters
+    return [{"page_number": page_num + 1, "table": table} for table in tables]
+
+
+def _pdf_page_all(doc, page, page_num, include_images=True, seen=None):
+    """Extracts text, hyperlinks, images and tables of a PDF page from a single page load; see _pdf_page_images for `seen`."""
+    images = _pdf_page_images(doc, page, page_num, seen) if include_images else []
+    return (_pdf_page_text(doc, page, page_num), _pdf_page_links(doc, page, page_num),
+            images, _pdf_page_tables(doc, page, page_num))
+
 
 class FileLoader(ABC):
     def __init__(self, file_path, expected_extension):
         self.file_path = file_path
         # Store the expected extension in lowercase
-        self.expected_extension = expected_extension.lower() 
+        self.expected_extension = expected_extension.lower()
+        # The file's own extension, computed once; compared with the expected one in validate_extension()
+        self.extension = file_extension(file_path)
 
     def validate_extension(self):
         """Validate the file extension against the expected extension."""
-        # Compare the file extension with the expected one, both in lowercase
-        if not self.file_path.lower().endswith(self.expected_extension):
+        # Compare the file extension with the expected one, both in lowercase and without the dot
+        if self.extension != self.expected_extension.lstrip('.'):
             raise ValueError(f"Invalid file format. Expected {self.expected_extension}.")
 
     @abstractmethod
@@ -22,6 +256,37 @@ class FileLoader(ABC):
         """Load the file content."""
         pass
 
+    # Extraction methods. Loaders override the ones their file type supports; `workers` is the
+    # number of processes a loader may spread the work over, and is ignored by loaders that don't.
+
+    def extract_text(self, workers=1):
+        """Extracts text with metadata."""
+        raise ValueError("Unsupported file type for text extraction.")
+
+    def extract_links(self, workers=1):
+        """Extracts hyperlinks with metadata."""
+        raise ValueError("Unsupported file type for link extraction.")
+
+    def extract_images(self, workers=1):
+        """Yields the images of the document."""
+        raise ValueError("Unsupported file type for image extraction.")
+
+    def extract_tables(self, workers=1):
+        """Extracts tables with metadata."""
+        raise ValueError("Unsupported file type for table extraction.")
+
+    def extract_all(self, include_images=True, workers=1):
+        """
+        Extracts text, hyperlinks, images and tables.
+
+        Returns:
+            tuple: (text_data, link_data, images_data, tables_data); images_data is None
+                when include_images is False.
+        """
+        images_data = list(self.extract_images(workers)) if include_images else None
+        return (self.extract_text(workers), self.extract_links(workers), images_data,
+                self.extract_tables(workers))
+
 
 class PDFLoader(FileLoader):
     def __init__(self, file_path):
@@ -37,13 +302,103 @@ class PDFLoader(FileLoader):
         Raises:
             ValueError: If the PDF file cannot be opened.
         """
+        if self.doc is not None:
+            return self.doc
         self.validate_extension()
         try:
-            self.doc = fitz.open(self.file_path)
+            self.doc = _open_pdf(self.file_path, file_mtime(self.file_path))
         except Exception as e:
             raise ValueError(f"Failed to load PDF file: {str(e)}")
         return self.doc
 
+    def _in_process(self, workers):
+        """Whether _map_pages handles the pages in this process rather than in a process pool."""
+        return workers <= 1 or len(self.doc) < MIN_PARALLEL_PAGES
+
+    def _image_cache(self, workers):
+        """A fresh image cache for an in-process extraction; None in a pool, whose workers keep their own."""
+        return OrderedDict() if self._in_process(workers) else None
+
+    def _map_pages(self, page_func, workers=1, opener=fitz.open):
+        """
+        Runs a page extraction function over every page and yields the per-page results in page order.
+
+        Small documents, or a single worker, are handled in-process. Otherwise the pages are spread
+        over a process pool in which every worker opens its own copy of the file with `opener`,
+        since open documents cannot be shared between processes.
+        """
+        page_count = len(self.doc)
+        if self._in_process(workers):
+            # Iterating the document yields its pages directly, without a load_page() lookup per index
+            for page_num, page in enumerate(self.doc):
+                yield page_func(self.doc, page, page_num)
+        else:
+            processes = min(workers, page_count)
+            # Contiguous runs of pages per task: fewer round trips to the workers than one task per page,
+            # while about four tasks per worker still even out pages that take longer than others
+            chunksize = max(1, page_count // (4 * processes))
+            with multiprocessing.Pool(processes, initializer=_init_pdf_worker,
+                                      initargs=(opener, self.file_path)) as pool:
+                yield from pool.imap(_pdf_page_worker, [(page_func, page_num) for page_num in range(page_count)],
+                                     chunksize)
+
+    def _concat_pages(self, page_func, workers=1, opener=fitz.open):
+        """Runs a page extraction function over every page and concatenates the results in page order."""
+        return [item for page_items in self._map_pages(page_func, workers, opener) for item in page_items]
+
+    def extract_text(self, workers=1):
+        """Extracts text from a PDF file."""
+        try:
+            text_data = self._concat_pages(_pdf_page_text, workers)
+        except Exception as e:
+            logging.error(f"Error extracting text from PDF: {str(e)}")
+            raise RuntimeError(f"Error extracting text from PDF: {str(e)}")
+        return text_data
+
+    def extract_links(self, workers=1):
+        """Extracts hyperlinks from a PDF file."""
+        try:
+            link_data = self._concat_pages(_pdf_page_links, workers)
+        except Exception as e:
+            logging.error(f"Error extracting links from PDF: {str(e)}")
+            raise RuntimeError(f"Error extracting links from PDF: {str(e)}")
+        return link_data
+
+    def extract_images(self, workers=1):
+        """Yields images from a PDF file."""
+        try:
+            page_func = functools.partial(_pdf_page_images, seen=self._image_cache(workers))
+            for page_images in self._map_pages(page_func, workers):
+                yield from page_images
+        except Exception as e:
+            logging.error(f"Error extracting images from PDF: {str(e)}")
+            raise RuntimeError(f"Error extracting images from PDF: {str(e)}")
+
+    def extract_tables(self, workers=1):
+        """Extracts tables from a PDF file using PyMuPDF's table finder on the already loaded document, with pdfplumber for the pages it does not handle."""
+        try:
+            table_data = self._concat_pages(_pdf_page_tables, workers)
+        except Exception as e:
+            logging.error(f"Error extracting tables from PDF: {str(e)}")
+            raise RuntimeError(f"Error extracting tables from PDF: {str(e)}")
+        return table_data
+
+    def extract_all(self, include_images=True, workers=1):
+        """Extracts text, hyperlinks, images and tables from a PDF file, loading every page once for all four."""
+        text_data, link_data, image_data, table_data = [], [], [], []
+        page_func = functools.partial(_pdf_page_all, include_images=include_images,
+                                      seen=self._image_cache(workers))
+        try:
+            for page_text, page_links, page_images, page_tables in self._map_pages(page_func, workers):
+                text_data.extend(page_text)
+                link_data.extend(page_links)
+                image_data.extend(page_images)
+                table_data.extend(page_tables)
+        except Exception as e:
+            logging.error(f"Error extracting data from PDF: {str(e)}")
+            raise RuntimeError(f"Error extracting data from PDF: {str(e)}")
+        return text_data, link_data, image_data if include_images else None, table_data
+
 
 class DOCXLoader(FileLoader):
     def __init__(self, file_path):
@@ -59,13 +414,99 @@ class DOCXLoader(FileLoader):
         Raises:
             ValueError: If the DOCX file cannot be opened.
         """
+        if self.doc is not None:
+            return self.doc
         self.validate_extension()
         try:
-            self.doc = docx.Document(self.file_path)
+            self.doc = _open_docx(self.file_path, file_mtime(self.file_path))
         except Exception as e:
             raise ValueError(f"Failed to load DOCX file: {str(e)}")
         return self.doc
 
+    def extract_text(self, workers=1):
+        """
+        Extracts text from a DOCX file.
+
+        Reads the body's w:p elements directly instead of wrapping each in a Paragraph, and
+        resolves style names from a map built once, as Paragraph.style would look them up per
+        paragraph. Paragraphs without a (known) paragraph style get the default style's name.
+        """
+        text_data = []
+        try:
+            styles = self.doc.styles
+            style_names = {style.style_id: style.name for style in styles if style.type == WD_STYLE_TYPE.PARAGRAPH}
+            default_style = styles.default(WD_STYLE_TYPE.PARAGRAPH)
+            default_name = default_style.name if default_style is not None else None
+            for p in self.doc.element.body.iterchildren(_DOCX_P):
+                text_data.append({
+                    "text": p.text,
+                    "style": style_names.get(p.style, default_name)
+                })
+        except Exception as e:
+            logging.error(f"Error extracting text from DOCX: {str(e)}")
+            raise RuntimeError(f"Error extracting text from DOCX: {str(e)}")
+        return text_data
+
+    def extract_links(self, workers=1):
+        """
+        Extracts hyperlinks from a DOCX file, read from the document's hyperlink relationships
+        and from HYPERLINK field codes, which keep their URL in the field instead.
+        """
+        link_data = []
+        try:
+            for rel in self.doc.part.rels.values():
+                if rel.reltype == RT.HYPERLINK and rel.target_ref:
+                    link_data.append({
+                        "url": rel.target_ref,
+                        "style": None
+                    })
+            for field_code in _docx_field_codes(self.doc.element.body):
+                match = _DOCX_HYPERLINK_FIELD.search(field_code)
+                if match and match.group(1):
+                    url, anchor = match.groups()
+                    link_data.append({
+                        "url": f"{url}#{quote(anchor, safe=_DOCX_ANCHOR_SAFE)}" if anchor else url,
+                        "style": None
+                    })
+        except Exception as e:
+            logging.error(f"Error extracting links from DOCX: {str(e)}")
+            raise RuntimeError(f"Error extracting links from DOCX: {str(e)}")
+        return link_data
+
+    def extract_images(self, workers=1):
+        """
+        Yields images from a DOCX file, taken from the image parts python-docx already holds in memory.
+
+        Only images related to the main document part are read, so the package thumbnail and
+        header and footer images are left out.
+        """
+        try:
+            for rel in self.doc.part.rels.values():
+                if rel.reltype == RT.IMAGE and not rel.is_external:
+                    part = rel.target_part
+                    yield {
+                        "image_data": part.blob,
+                        "image_extension": part.partname.ext.lower()
+                    }
+        except Exception as e:
+            logging.error(f"Error extracting images from DOCX: {str(e)}")
+            raise RuntimeError(f"Error extracting images from DOCX: {str(e)}")
+
+    def extract_tables(self, workers=1):
+        """Extracts tables from a DOCX file."""
+        try:
+            table_data = [
+                {
+                    "table_number": table_num + 1,
+                    "table": [[_docx_cell_text(cell) for cell in row.cells] for row in table.rows]
+                }
+                for table_num, table in enumerate(self.doc.tables)
+            ]
+        except Exception as e:
+            logging.error(f"Error extracting tables from DOCX: {str(e)}")
+            raise RuntimeError(f"Error extracting tables from DOCX: {str(e)}")
+        return table_data
+
 
 class PPTLoader(FileLoader):
     def __init__(self, file_path):
@@ -81,17 +522,115 @@ class PPTLoader(FileLoader):
         Raises:
             ValueError: If the PPTX file cannot be opened.
         """
+        if self.presentation is not None:
+            return self.presentation
         self.validate_extension()
         try:
-            self.presentation = Presentation(self.file_path)
+            self.presentation = _open_pptx(self.file_path, file_mtime(self.file_path))
         except Exception as e:
             raise ValueError(f"Failed to load PPTX file: {str(e)}")
         return self.presentation
 
+    def extract_text(self, workers=1):
+        """Extracts text from a PPTX file."""
+        return self._extract_text_and_links()[0]
+
+    def extract_links(self, workers=1):
+        """Extracts hyperlinks from a PPTX file."""
+        return self._extract_text_and_links()[1]
+
+    def extract_all(self, include_images=True, workers=1):
+        """Extracts text, hyperlinks, images and tables from a PPTX file, reading text and hyperlinks in one pass."""
+        text_data, link_data = self._extract_text_and_links()
+        images_data = list(self.extract_images(workers)) if include_images else None
+        return text_data, link_data, images_data, self.extract_tables(workers)
+
+    def _extract_text_and_links(self):
+        """
+        Extracts the text and the hyperlinks of a PPTX file in a single walk over the slide shapes.
+
+        Returns:
+            tuple: (text_data, link_data)
+        """
+        text_data = []
+        link_data = []
+        append_text = text_data.append
+        append_link = link_data.append
+        try:
+            for slide_num, slide in enumerate(self.presentation.slides):
+                slide_number = slide_num + 1
+                slide_text = []
+                for shape in slide.shapes:
+                    text = getattr(shape, "text", None)
+                    if text is not None:
+                        slide_text.append(text)
+
+                    # Check if the shape contains text and has a hyperlink attribute
+                    if shape.has_text_frame:
+                        for paragraph in shape.text_frame.paragraphs:
+                            for run in paragraph.runs:
+                                address = run.hyperlink.address
+                                if address:
+                                    append_link({"slide_number": slide_number, "url": address})
+                    else:
+                        hyperlink = getattr(shape, "hyperlink", None)
+                        if hyperlink is not None and hyperlink.address:
+                            append_link({"slide_number": slide_number, "url": hyperlink.address})
+
+                # Join the slide text list into a single string separated by newlines
+                append_text({
+                    "slide_number": slide_number,
+                    "text": "\n".join(slide_text)  # Join text list into a single string
+                })
+        except Exception as e:
+            logging.error(f"Error extracting text and links from PPTX: {str(e)}")
+            raise RuntimeError(f"Error extracting text and links from PPTX: {str(e)}")
+        return text_data, link_data
+
+    def extract_images(self, workers=1):
+        """Yields images from a PPTX file."""
+        try:
+            for slide_num, slide in enumerate(self.presentation.slides):
+                for shape in slide.shapes:
+                    if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+                        image = shape.image  # builds a new Image from the image part on every access
+                        yield {
+                            "slide_number": slide_num + 1,
+                            "image_data": image.blob,
+                            "image_extension": image.ext
+                        }
+        except Exception as e:
+            logging.error(f"Error extracting images from PPTX: {str(e)}")
+            raise RuntimeError(f"Error extracting images from PPTX: {str(e)}")
+
+    def extract_tables(self, workers=1):
+        """Extracts tables from a PPTX file."""
+        try:
+            table_data = [
+                {
+                    "slide_number": slide_num + 1,
+                    "table": [[_ppt_cell_text(cell) for cell in row.cells] for row in shape.table.rows]
+                }
+                for slide_num, slide in enumerate(self.presentation.slides)
+                for shape in slide.shapes if shape.has_table
+            ]
+        except Exception as e:
+            logging.error(f"Error extracting tables from PPTX: {str(e)}")
+            raise RuntimeError(f"Error extracting tables from PPTX: {str(e)}")
+        return table_data
+
+
+# Loader class and output sub-directory for each supported extension (lowercase, without the dot).
+DEFAULT_LOADERS = {
+    'pdf': (PDFLoader, "PDF"),
+    'docx': (DOCXLoader, "DOCX"),
+    'pptx': (PPTLoader, "PPTX"),
+}
+
 
 class FileLoaderRegistry:
     """Registry to map file extensions to loader classes and their output directories."""
-    
+
     def __init__(self, output_dir):
         """Initialize the registry with the base output directory.
 
@@ -100,13 +639,12 @@ class FileLoaderRegistry:
         """
         self.output_dir = output_dir
         os.makedirs(self.output_dir, exist_ok=True)  # Ensure base output dir exists
-        
+
         self.loader_map = {
-            'pdf': (PDFLoader, os.path.join(self.output_dir, "PDF")),
-            'docx': (DOCXLoader, os.path.join(self.output_dir, "DOCX")),
-            'pptx': (PPTLoader, os.path.join(self.output_dir, "PPTX")),
+            extension: (loader_class, os.path.join(self.output_dir, output_subdir))
+            for extension, (loader_class, output_subdir) in DEFAULT_LOADERS.items()
         }
-        
+
         # Create subdirectories for loaders
         for _, subdir in self.loader_map.values():
             os.makedirs(subdir, exist_ok=True)
@@ -125,3 +663,14 @@ class FileLoaderRegistry:
             tuple: The loader class and corresponding output directory, or None if not found.
         """
         return self.loader_map.get(file_extension)
+
+    def get_loader_for_path(self, file_path):
+        """Get the loader class and output directory for a file, looked up by its extension.
+
+        Args:
+            file_path (str): The path or name of the file.
+
+        Returns:
+            tuple: The loader class and corresponding output directory, or None if not found.
+        """
+        return self.loader_map.get(file_extension(file_path))
@@ -5,6 +5,20 @@ from dotenv import load_dotenv
 from file_loaders import FileLoaderRegistry
 from processing import Processing
 
+
+def load_db_config():
+    """Read the database configuration from the environment (.env), or None if any value is missing."""
+    load_dotenv()
+    db_config = {
+        'user': os.getenv('DB_USER'),
+        'password': os.getenv('DB_PASSWORD'),
+        'host': os.getenv('DB_HOST'),
+        'database': os.getenv('DB_DATABASE'),
+    }
+    if None in db_config.values():
+        return None
+    return db_config
+
 def main():
     """Main entry point of the application."""
     # Define project root and directories
@@ -19,36 +33,39 @@ def main():
     # registry.register_loader('xlsx', XLSXLoader, "XLSX")
 
     while True:
-        # Get the filename from the user
-        file_name = input("Enter the filename (with extension): ").strip()
+        # Get the filename (or a directory to process in batch) from the user
+        file_name = input("Enter the filename (with extension) or a directory: ").strip()
         if file_name.lower() == 'exit':
             print("Exiting the program.")
             break
         file_path = os.path.join(base_dir, file_name)
 
+        # Process every supported file of a directory in parallel
+        if file_name and os.path.isdir(file_path):
+            db_config = load_db_config()
+            if db_config is None:
+                print("Database configuration is missing. Please check your .env file.")
+                return
+            count = Processing.process_directory(file_path, registry, db_config)
+            print(f"Processed {count} file(s) from '{file_path}'.")
+            continue
+
         # Check if the file exists
         if not os.path.isfile(file_path):
             print(f"The file at the path '{file_path}' does not exist. Please provide a valid relative path.")
             continue  # Prompt for input again if the file does not exist
 
-        # Extract file extension and get loader class/output directory from the registry
-        file_extension = file_name.split('.')[-1].lower()
-        loader_class_output = registry.get_loader_and_output_dir(file_extension)
+        # Get loader class/output directory for the file's extension from the registry
+        loader_class_output = registry.get_loader_for_path(file_name)
 
         if loader_class_output:
             loader_class, output_folder = loader_class_output
 
             # Get database configuration from environment variables
-            load_dotenv()
-            db_config = {
-                'user': os.getenv('DB_USER'),
-                'password': os.getenv('DB_PASSWORD'),
-                'host': os.getenv('DB_HOST'),
-                'database': os.getenv('DB_DATABASE'),
-            }
+            db_config = load_db_config()
 
             # Check for missing environment variables
-            if None in db_config.values():
+            if db_config is None:
                 print("Database configuration is missing. Please check your .env file.")
                 return
 
@@ -1,25 +1,93 @@
 from data_extractor import DataExtractor
 from storage import FileStorage, MySQLStorage
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
 import os
+import queue
 import shutil  # To delete directories
+import threading
+
+# Images waiting for each storage. process_file blocks when a storage falls this far behind,
+# so a document's images are never all held in memory.
+IMAGE_QUEUE_SIZE = 8
+
+# Marks the end of an image stream
+_END = object()
+
+
+def _process_one(job):
+    """Worker entry point for Processing.process_directory; runs in its own process."""
+    loader_class, file_path, output_folder, db_config = job
+    # Files are already spread across processes, so each file is extracted in-process.
+    Processing.process_file(loader_class, file_path, output_folder, db_config, workers=1)
+
+
+class _ImageStream:
+    """Bounded queue handing the images read once by process_file to one storage."""
+
+    def __init__(self):
+        self._queue = queue.Queue(maxsize=IMAGE_QUEUE_SIZE)
+        self._closed = threading.Event()
+
+    def put(self, item):
+        """Queue an image (or the end of the stream); dropped once the storage has stopped reading."""
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def finish(self, error=None):
+        """End the stream; the storage's iteration raises error if one is given."""
+        self.put(_END if error is None else error)
+
+    def close(self):
+        """Called by the storage side when it stops reading."""
+        self._closed.set()
+
+    def __iter__(self):
+        while True:
+            item = self._queue.get()
+            if item is _END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+def _fan_out_images(images, streams):
+    """Hand every image to each stream, then end the streams (with the error, if reading failed)."""
+    try:
+        for image in images:
+            for stream in streams:
+                stream.put(image)
+    except Exception as e:
+        for stream in streams:
+            stream.finish(e)
+        raise
+    for stream in streams:
+        stream.finish()
+
 
 class Processing:
     """Class responsible for processing files and managing data extraction and storage."""
 
     @staticmethod
-    def process_file(loader_class, file_path, output_folder, db_config):
+    def process_file(loader_class, file_path, output_folder, db_config, workers=None):
         """
         Process a file to extract data and save it to specified storage.
 
         This method deletes any existing output folder for the file type, creates a new one,
-        extracts data using the DataExtractor, and saves the data to both file storage
-        and MySQL database.
+        extracts data using the DataExtractor, and saves the data to file storage and the
+        MySQL database concurrently.
 
         Args:
             loader_class (class): The loader class to handle the specific file type.
             file_path (str): The path to the file to be processed.
             output_folder (str): The folder where extracted data will be saved.
             db_config (dict): Configuration dictionary for MySQL database connection.
+            workers (int, optional): Number of processes used for per-page PDF extraction.
 
         Raises:
             Exception: Raises an exception if the data extraction fails or any storage operation fails.
@@ -32,37 +100,96 @@ class Processing:
 
             # Initialize the loader and extractor
             loader = loader_class(file_path)
-            extractor = DataExtractor(loader)
+            extractor = DataExtractor(loader, workers=workers)
 
             # Extract data
             try:
-                text_data = extractor.extract_text()
-                link_data = extractor.extract_links()
-                images_data = extractor.extract_images()
-                tables_data = extractor.extract_tables()
+                # Images are streamed into each storage separately below instead of being held in memory
+                text_data, link_data, _, tables_data = extractor.extract_all(include_images=False)
             except Exception as e:
                 raise Exception(f"Data extraction failed: {e}")
 
-            # Save data to file storage
-            try:
-                file_storage = FileStorage(output_folder)
-                file_storage.save_text(text_data)
-                file_storage.save_links(link_data)
-                file_storage.save_images(images_data)
-                file_storage.save_tables(tables_data)
-            except Exception as e:
-                raise Exception(f"Failed to save data to file storage: {e}")
+            # Images are read once, here, and handed to both storages. The first one is read before the
+            # storage threads start, so a PDF's process pool is forked while this is the only thread.
+            images = extractor.iter_images()
+            first_image = next(images, None)
+            if first_image is not None:
+                images = chain((first_image,), images)
+            file_images, mysql_images = _ImageStream(), _ImageStream()
 
-            # Save data to MySQL storage
-            try:
-                mysql_storage = MySQLStorage(db_config)
-                mysql_storage.save_text(text_data)
-                mysql_storage.save_images(images_data)
-                mysql_storage.save_tables(tables_data)
-                mysql_storage.save_links(link_data)
-                mysql_storage.close()
-            except Exception as e:
-                raise Exception(f"Failed to save data to MySQL storage: {e}")
+            # File and MySQL storage are independent and I/O bound, so save to both concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                file_future = executor.submit(Processing._save_to_files, output_folder, file_images,
+                                              text_data, link_data, tables_data)
+                mysql_future = executor.submit(Processing._save_to_mysql, db_config, mysql_images,
+                                               text_data, link_data, tables_data)
+                _fan_out_images(images, (file_images, mysql_images))
+                file_future.result()
+                mysql_future.result()
 
         except Exception as e:
             print(f"Processing failed for file {file_path}: {e}")
+
+    @staticmethod
+    def _save_to_files(output_folder, images, text_data, link_data, tables_data):
+        """Save the extracted data to file storage, taking the images from an _ImageStream."""
+        try:
+            file_storage = FileStorage(output_folder)
+            file_storage.save_text(text_data)
+            file_storage.save_links(link_data)
+            file_storage.save_images(images)
+            file_storage.save_tables(tables_data)
+            file_storage.close()  # wait for the queued image and table writes
+        except Exception as e:
+            raise Exception(f"Failed to save data to file storage: {e}")
+        finally:
+            images.close()
+
+    @staticmethod
+    def _save_to_mysql(db_config, images, text_data, link_data, tables_data):
+        """Save the extracted data to MySQL storage, taking the images from an _ImageStream."""
+        try:
+            mysql_storage = MySQLStorage(db_config)
+            mysql_storage.save_text(text_data)
+            mysql_storage.save_images(images)
+            mysql_storage.save_tables(tables_data)
+            mysql_storage.save_links(link_data)
+            mysql_storage.close()
+        except Exception as e:
+            raise Exception(f"Failed to save data to MySQL storage: {e}")
+        finally:
+            images.close()
+
+    @staticmethod
+    def process_directory(directory, registry, db_config, max_workers=None):
+        """
+        Process every supported file in a directory, one file per worker process.
+
+        Each file is written to its own sub-folder of its file type's output directory so
+        that concurrent workers do not delete each other's output. Every worker opens its
+        own MySQL connection, since connections cannot be shared across processes.
+
+        Args:
+            directory (str): The directory containing the files to process.
+            registry (FileLoaderRegistry): Registry used to look up loaders and output directories.
+            db_config (dict): Configuration dictionary for MySQL database connection.
+            max_workers (int, optional): Number of worker processes. Defaults to one less than the CPU count.
+
+        Returns:
+            int: The number of files submitted for processing.
+        """
+        jobs = []
+        for file_name in sorted(os.listdir(directory)):
+            file_path = os.path.join(directory, file_name)
+            loader_class_output = registry.get_loader_for_path(file_name)
+            if not os.path.isfile(file_path) or not loader_class_output:
+                continue
+            loader_class, output_folder = loader_class_output
+            file_output_folder = os.path.join(output_folder, os.path.splitext(file_name)[0])
+            jobs.append((loader_class, file_path, file_output_folder, db_config))
+
+        if jobs:
+            max_workers = max_workers or max(1, (os.cpu_count() or 1) - 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(_process_one, jobs))
+        return len(jobs)
@@ -1,12 +1,156 @@
 import os
 import csv
 import logging
+import mmap
+import json
+import zlib
 from abc import ABC, abstractmethod
 import mysql.connector
-from typing import List, Dict, Any, Optional
+from mysql.connector.pooling import MySQLConnectionPool
+from contextlib import contextmanager
+from itertools import islice
+import queue
+import threading
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library encoder
+    orjson = None
 
 logging.basicConfig(level=logging.INFO)
 
+# Buffer size for CSV table files, so that each table is flushed in as few write syscalls as possible.
+CSV_BUFFER_SIZE = 1 << 20
+
+# Background threads writing image and table files for a FileStorage; the writes are I/O bound.
+IMAGE_WRITE_WORKERS = 8
+
+# Files waiting for a writer thread. save_images blocks when the queue is full, so a streamed
+# source is never drained into memory faster than it is written.
+WRITE_QUEUE_SIZE = 2 * IMAGE_WRITE_WORKERS
+
+# Images at least this large bypass (or are evicted from) the page cache when written; they
+# are not read back during ingest and would otherwise push more useful pages out.
+LARGE_BLOB_SIZE = 2 << 20
+
+# Image rows per executemany call, to keep each INSERT packet bounded.
+IMAGE_BATCH_SIZE = 500
+
+# Images stored in MySQL are zlib-compressed at this level (fast; most of the gain of the higher levels).
+IMAGE_COMPRESS_LEVEL = 1
+
+# Image formats that are already compressed; zlib would spend CPU on them for next to no saving.
+PRECOMPRESSED_IMAGE_EXTENSIONS = frozenset({'jpg', 'jpeg', 'png', 'webp'})
+
+# Connection options applied on top of the user's db_config. Compression shrinks the
+# LONGBLOB image payloads on the wire; the C extension is used whenever it is installed.
+MYSQL_CONNECT_OPTIONS = {
+    'compress': True,
+    'use_pure': not mysql.connector.HAVE_CEXT,
+    'autocommit': False,
+}
+
+# Connections kept open per process and database configuration. MySQLConnectionPool opens all of
+# them up front and each worker process saves from one thread, so one connection is in use at a
+# time; the second lets a save start while the previous connection is being returned.
+MYSQL_POOL_SIZE = 2
+
+# Location keys of an extracted link, in order of precedence, and their labels in extracted_links.txt.
+LINK_LOCATION_LABELS = (('page_number', 'Page'), ('slide_number', 'Slide'), ('paragraph_number', 'Paragraph'))
+
+# Single-row INSERT templates. A regular (non-prepared) cursor's executemany() rewrites each
+# batch of rows into one multi-row INSERT ... VALUES (...), (...) statement, one round trip per batch.
+INSERT_TEXT_SQL = "INSERT INTO text_data (content, page_number) VALUES (%s, %s)"
+INSERT_IMAGE_SQL = ("INSERT INTO images_data (image_data, image_extension, page_number, compressed) "
+                    "VALUES (%s, %s, %s, %s)")
+INSERT_TABLE_SQL = "INSERT INTO tables_data (table_data, page_number) VALUES (%s, %s)"
+INSERT_LINK_SQL = "INSERT INTO links_data (url, page_number) VALUES (%s, %s)"
+
+def _dumps_table(table: List[List[Any]]) -> str:
+    """Serialize a table (list of rows) to compact JSON for the table_data column."""
+    if orjson is not None:
+        return orjson.dumps(table).decode()
+    return json.dumps(table, separators=(',', ':'), ensure_ascii=False)
+
+
+def _compress_image(image_data: bytes, image_extension: str) -> Tuple[bytes, int]:
+    """Return the image bytes to store in MySQL and the value of the images_data.compressed flag.
+
+    Rows flagged 1 hold zlib data and are read back with zlib.decompress(image_data).
+    """
+    if image_extension.lower() in PRECOMPRESSED_IMAGE_EXTENSIONS:
+        return image_data, 0
+    return zlib.compress(image_data, IMAGE_COMPRESS_LEVEL), 1
+
+
+def _image_record(item: Dict[str, Any]) -> Tuple[bytes, str, Optional[int], int]:
+    """Build the INSERT_IMAGE_SQL parameters for one extracted image."""
+    image_data, compressed = _compress_image(item["image_data"], item["image_extension"])
+    return image_data, item["image_extension"], item.get("page_number", None), compressed
+
+
+def _link_location(link: Dict[str, Any]) -> str:
+    """Label of the page, slide or paragraph a link was found on, e.g. 'Page 3'; '' if it has none."""
+    for key, label in LINK_LOCATION_LABELS:
+        if key in link:
+            return f"{label} {link[key]}"
+    return ""
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """Reserve the blocks of a file up front so the filesystem can allocate contiguous extents."""
+    if size and hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            pass  # not supported by every filesystem; the write allocates as it goes
+
+
+def _write_blob(path: str, data: bytes) -> None:
+    """Write a large blob without leaving it in the page cache.
+
+    Uses O_DIRECT with a page-aligned buffer where the platform and filesystem support it,
+    otherwise a regular write followed by POSIX_FADV_DONTNEED. Either way the file is
+    preallocated to its final size first.
+    """
+    if hasattr(os, 'O_DIRECT'):
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644)
+        except OSError:
+            fd = None  # e.g. tmpfs does not support O_DIRECT
+        if fd is not None:
+            try:
+                _preallocate(fd, len(data))
+                # O_DIRECT needs an aligned buffer and length; anonymous mmaps are page-aligned
+                padded = -(-len(data) // mmap.PAGESIZE) * mmap.PAGESIZE
+                with mmap.mmap(-1, padded) as buffer:
+                    buffer[:len(data)] = data
+                    # Every view must be released before the mmap closes, also when a write fails
+                    with memoryview(buffer) as view:
+                        written = 0
+                        while written < padded:
+                            with view[written:] as chunk:
+                                written += os.write(fd, chunk)
+                os.ftruncate(fd, len(data))
+                return
+            except OSError:
+                # Drop the preallocated (zero-filled) blocks, then fall back to a buffered write below
+                try:
+                    os.ftruncate(fd, 0)
+                except OSError:
+                    pass
+            finally:
+                os.close(fd)
+
+    with open(path, 'wb') as blob_file:
+        _preallocate(blob_file.fileno(), len(data))
+        blob_file.write(data)
+        if hasattr(os, 'posix_fadvise'):
+            blob_file.flush()
+            os.fdatasync(blob_file.fileno())
+            os.posix_fadvise(blob_file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
 class Storage(ABC):
     """Abstract class for storing extracted data."""
 
@@ -16,8 +160,8 @@ class Storage(ABC):
         pass
 
     @abstractmethod
-    def save_images(self, images_data: List[Dict[str, Any]]) -> None:
-        """Save extracted images."""
+    def save_images(self, images_data: Iterable[Dict[str, Any]]) -> None:
+        """Save extracted images, consuming them one at a time."""
         pass
 
     @abstractmethod
@@ -43,15 +187,21 @@ class FileStorage(Storage):
         """
         self.output_directory = output_directory
         os.makedirs(self.output_directory, exist_ok=True)
+        # Image and table writes are handed to background threads, started on first use; see flush()/close()
+        self._write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writers = []
 
-    def save_text(self, text_data: List[str]) -> None:
-        """Save extracted text to a text file."""
+    def save_text(self, text_data: List[Dict[str, Any]]) -> None:
+        """Save the text of each extracted entry (or plain string) to a UTF-8 text file, one entry per line."""
         if not isinstance(text_data, list):
             raise ValueError("text_data must be a list.")
         
         try:
-            with open(os.path.join(self.output_directory, 'extracted_text.txt'), 'w') as f:
-                f.writelines(f"{entry}\n" for entry in text_data)
+            payload = "".join(
+                f"{entry['text'] if isinstance(entry, dict) else entry}\n" for entry in text_data
+            ).encode('utf-8')
+            with open(os.path.join(self.output_directory, 'extracted_text.txt'), 'wb') as f:
+                f.write(payload)
             logging.info("Text data saved successfully.")
         except Exception as e:
             logging.error(f"Failed to save text data: {e}")
@@ -62,146 +212,239 @@ class FileStorage(Storage):
             raise ValueError("links_data must be a list.")
         
         try:
+            # Links from one extractor share a location key, so look it up once from the first link;
+            # a link without that key falls back to the full lookup
+            first = links_data[0] if links_data else {}
+            key, label = next(((k, l) for k, l in LINK_LOCATION_LABELS if k in first), (None, None))
+            lines = [
+                f"{label} {link[key]} -> {link.get('url', 'No URL')}\n" if key in link
+                else f"{_link_location(link)} -> {link.get('url', 'No URL')}\n"
+                for link in links_data
+            ]
             with open(os.path.join(self.output_directory, 'extracted_links.txt'), 'w') as f:
-                for link in links_data:
-                    location = ""
-                    if 'page_number' in link:
-                        location = f"Page {link['page_number']}"
-                    elif 'slide_number' in link:
-                        location = f"Slide {link['slide_number']}"
-                    elif 'paragraph_number' in link:
-                        location = f"Paragraph {link['paragraph_number']}"
-
-                    url = link.get('url', 'No URL')
-                    f.write(f"{location} -> {url}\n")
+                f.write("".join(lines))
             logging.info("Links data saved successfully.")
         except Exception as e:
             logging.error(f"Failed to save links data: {e}")
 
-    def save_images(self, images_data: List[Dict[str, Any]]) -> None:
-        """Save extracted images and metadata to the output directory."""
-        if not isinstance(images_data, list):
-            raise ValueError("images_data must be a list.")
+    def save_images(self, images_data: Iterable[Dict[str, Any]]) -> None:
+        """Queue extracted images and metadata for the background writers; call flush() or close() to wait for them."""
+        if not isinstance(images_data, Iterable):
+            raise ValueError("images_data must be an iterable.")
         
         try:
             for i, image in enumerate(images_data):
-                image_extension = image.get("image_extension", "png")
-                image_path = os.path.join(self.output_directory, f'image_{i}.{image_extension}')
-                metadata_path = os.path.join(self.output_directory, f'image_{i}_metadata.txt')
-
-                with open(image_path, 'wb') as img_file:
-                    img_file.write(image['image_data'])
-
-                with open(metadata_path, 'w') as metafile:
-                    metafile.write(f"Image {i + 1} Metadata\n")
-                    if 'page_number' in image:
-                        metafile.write(f"Extracted from PDF - Page {image['page_number']}\n")
-                    elif 'slide_number' in image:
-                        metafile.write(f"Extracted from PowerPoint - Slide {image['slide_number']}\n")
-                    else:
-                        metafile.write("Extracted from Word document\n")
-                    
-                    metafile.write(f"Image Extension: {image_extension}\n")
-                    metafile.write(f"Image Size: {len(image['image_data'])} bytes\n")
-            logging.info("Images data saved successfully.")
+                self._enqueue_write(self._write_one_image, i, image)
+            logging.info("Images data queued for saving.")
         except Exception as e:
             logging.error(f"Failed to save images data: {e}")
 
+    def flush(self) -> None:
+        """Block until every queued image and table has been written."""
+        self._write_queue.join()
+
+    def close(self) -> None:
+        """Write any queued images and tables and stop the writer threads."""
+        self.flush()
+        for _ in self._writers:
+            self._write_queue.put(None)
+        for writer in self._writers:
+            writer.join()
+        self._writers = []
+
+    def _enqueue_write(self, write, *args) -> None:
+        """Queue a write for the writer threads, starting them on first use."""
+        if not self._writers:
+            self._writers = [threading.Thread(target=self._drain_writes, daemon=True)
+                             for _ in range(IMAGE_WRITE_WORKERS)]
+            for writer in self._writers:
+                writer.start()
+        self._write_queue.put((write, args))
+
+    def _drain_writes(self) -> None:
+        """Writer thread: run queued writes until a None sentinel arrives."""
+        while True:
+            job = self._write_queue.get()
+            try:
+                if job is None:
+                    return
+                write, args = job
+                write(*args)
+            except Exception as e:
+                logging.error(f"Failed to save queued file: {e}")
+            finally:
+                self._write_queue.task_done()
+
+    def _write_one_image(self, i: int, image: Dict[str, Any]) -> None:
+        """Write one image and its metadata file."""
+        image_extension = image.get("image_extension", "png")
+        image_path = os.path.join(self.output_directory, f'image_{i}.{image_extension}')
+        metadata_path = os.path.join(self.output_directory, f'image_{i}_metadata.txt')
+
+        if len(image['image_data']) >= LARGE_BLOB_SIZE:
+            _write_blob(image_path, image['image_data'])
+        else:
+            with open(image_path, 'wb') as img_file:
+                img_file.write(image['image_data'])
+
+        with open(metadata_path, 'w') as metafile:
+            metafile.write(f"Image {i + 1} Metadata\n")
+            if 'page_number' in image:
+                metafile.write(f"Extracted from PDF - Page {image['page_number']}\n")
+            elif 'slide_number' in image:
+                metafile.write(f"Extracted from PowerPoint - Slide {image['slide_number']}\n")
+            else:
+                metafile.write("Extracted from Word document\n")
+
+            metafile.write(f"Image Extension: {image_extension}\n")
+            metafile.write(f"Image Size: {len(image['image_data'])} bytes\n")
+
     def save_tables(self, tables_data: List[Dict[str, Any]]) -> None:
-        """Save extracted tables as CSV files along with metadata."""
+        """Queue extracted tables for the background writers as CSV files along with metadata; call flush() or close() to wait for them."""
         if not isinstance(tables_data, list):
             raise ValueError("tables_data must be a list.")
         
         try:
             for i, table in enumerate(tables_data):
-                page_number = table.get("page_number", table.get("slide_number", "unknown_location"))
-                table_rows = table.get("table", [])
-
-                table_path = os.path.join(self.output_directory, f'table_{i}_location_{page_number}.csv')
-                metadata_path = os.path.join(self.output_directory, f'table_{i}_location_{page_number}_metadata.txt')
-
-                with open(table_path, 'w', newline='') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerows(table_rows)
-
-                with open(metadata_path, 'w') as metafile:
-                    metafile.write(f"Table {i + 1} Metadata\n")
-                    if 'page_number' in table:
-                        metafile.write(f"Extracted from PDF - Page {table['page_number']}\n")
-                    elif 'slide_number' in table:
-                        metafile.write(f"Extracted from PowerPoint - Slide {table['slide_number']}\n")
-                    else:
-                        metafile.write("Extracted from Word document\n")
-
-                    metafile.write(f"Number of rows: {len(table_rows)}\n")
-                    if table_rows:
-                        metafile.write(f"Number of columns: {len(table_rows[0])}\n")
-                    else:
-                        metafile.write("Number of columns: 0\n")
-            logging.info("Tables data saved successfully.")
+                self._enqueue_write(self._write_one_table, i, table)
+            logging.info("Tables data queued for saving.")
         except Exception as e:
             logging.error(f"Failed to save tables data: {e}")
 
+    def _write_one_table(self, i: int, table: Dict[str, Any]) -> None:
+        """Write one table as CSV and its metadata file."""
+        page_number = table.get("page_number", table.get("slide_number", "unknown_location"))
+        table_rows = table.get("table", [])
+
+        table_path = os.path.join(self.output_directory, f'table_{i}_location_{page_number}.csv')
+        metadata_path = os.path.join(self.output_directory, f'table_{i}_location_{page_number}_metadata.txt')
+
+        with open(table_path, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+            # Quote only cells that need it and end rows with a bare newline
+            writer = csv.writer(csvfile, quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+            writer.writerows(table_rows)
+
+        with open(metadata_path, 'w') as metafile:
+            metafile.write(f"Table {i + 1} Metadata\n")
+            if 'page_number' in table:
+                metafile.write(f"Extracted from PDF - Page {table['page_number']}\n")
+            elif 'slide_number' in table:
+                metafile.write(f"Extracted from PowerPoint - Slide {table['slide_number']}\n")
+            else:
+                metafile.write("Extracted from Word document\n")
+
+            metafile.write(f"Number of rows: {len(table_rows)}\n")
+            if table_rows:
+                metafile.write(f"Number of columns: {len(table_rows[0])}\n")
+            else:
+                metafile.write("Number of columns: 0\n")
+
 
 class MySQLStorage(Storage):
-    """Concrete class for storing extracted data into a MySQL database."""
+    """Concrete class for storing extracted data into a MySQL database.
 
-    def __init__(self, db_config: Dict[str, Any]) -> None:
+    Connections come from a pool shared by every MySQLStorage of the process with the same
+    configuration, so storing another file does not repeat the TCP and authentication handshake.
+    """
+
+    # Connection pools by (process id, database configuration)
+    _pools: Dict[Any, MySQLConnectionPool] = {}
+
+    def __init__(self, db_config: Dict[str, Any], pool_size: int = MYSQL_POOL_SIZE) -> None:
         """
         Initialize MySQLStorage with database configuration.
 
         Args:
             db_config (dict): Configuration dictionary for MySQL connection.
+            pool_size (int): Connections in the process's pool for db_config; only used by the
+                first MySQLStorage that creates the pool.
         """
         try:
-            self.connection = mysql.connector.connect(**db_config)
-            self.cursor = self.connection.cursor()
+            self._pool = self._get_pool(db_config, pool_size)
             self.create_tables()
             logging.info("MySQL database connection established successfully.")
         except mysql.connector.Error as e:
             logging.error(f"Failed to connect to MySQL database: {e}")
             raise
 
+    @classmethod
+    def _get_pool(cls, db_config: Dict[str, Any], pool_size: int = MYSQL_POOL_SIZE) -> MySQLConnectionPool:
+        """Return the process's connection pool for db_config, creating it on first use.
+
+        Pools are keyed by process id as well, since pooled sockets must not be shared with
+        forked worker processes. The configuration is keyed by its JSON form, as values such
+        as ssl options may be unhashable.
+        """
+        key = (os.getpid(), json.dumps(db_config, sort_keys=True, default=repr))
+        pool = cls._pools.get(key)
+        if pool is None:
+            pool = MySQLConnectionPool(pool_name=f"doc_pool_{len(cls._pools)}", pool_size=pool_size,
+                                       **{**MYSQL_CONNECT_OPTIONS, **db_config})
+            cls._pools[key] = pool
+        return pool
+
+    @contextmanager
+    def _transaction(self):
+        """Yield a cursor on a pooled connection; commit on success and roll back on a MySQL error.
+
+        The connection goes back to the pool when the block exits.
+        """
+        connection = self._pool.get_connection()
+        cursor = connection.cursor()
+        try:
+            yield cursor
+            connection.commit()
+        except mysql.connector.Error:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+
     def create_tables(self) -> None:
         """Create tables in the database for storing extracted data."""
         try:
-            self.cursor.execute('''
-                CREATE TABLE IF NOT EXISTS text_data (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    content TEXT NOT NULL,
-                    page_number INT
-                )
-            ''')
-
-            self.cursor.execute('''
-                CREATE TABLE IF NOT EXISTS images_data (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    image_data LONGBLOB NOT NULL,
-                    image_extension VARCHAR(10),
-                    page_number INT
-                )
-            ''')
-
-            self.cursor.execute('''
-                CREATE TABLE IF NOT EXISTS tables_data (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    table_data TEXT NOT NULL,
-                    page_number INT
-                )
-            ''')
-
-            self.cursor.execute('''
-                CREATE TABLE IF NOT EXISTS links_data (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    url TEXT NOT NULL,
-                    page_number INT
-                )
-            ''')
-            self.connection.commit()
+            with self._transaction() as cursor:
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS text_data (
+                        id INT AUTO_INCREMENT PRIMARY KEY,
+                        content TEXT NOT NULL,
+                        page_number INT
+                    )
+                ''')
+
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS images_data (
+                        id INT AUTO_INCREMENT PRIMARY KEY,
+                        image_data LONGBLOB NOT NULL,
+                        image_extension VARCHAR(10),
+                        page_number INT,
+                        compressed TINYINT NOT NULL DEFAULT 0
+                    )
+                ''')
+                # Tables created before image compression was added lack the flag column
+                cursor.execute("SHOW COLUMNS FROM images_data LIKE 'compressed'")
+                if not cursor.fetchall():
+                    cursor.execute("ALTER TABLE images_data ADD COLUMN compressed TINYINT NOT NULL DEFAULT 0")
+
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS tables_data (
+                        id INT AUTO_INCREMENT PRIMARY KEY,
+                        table_data TEXT NOT NULL,
+                        page_number INT
+                    )
+                ''')
+
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS links_data (
+                        id INT AUTO_INCREMENT PRIMARY KEY,
+                        url TEXT NOT NULL,
+                        page_number INT
+                    )
+                ''')
             logging.info("Database tables created successfully.")
         except mysql.connector.Error as e:
             logging.error(f"Failed to create tables: {e}")
-            self.connection.rollback()
 
     def save_text(self, text_data: List[Dict[str, Any]]) -> None:
         """Save extracted text data to the database."""
@@ -209,34 +452,35 @@ class MySQLStorage(Storage):
             raise ValueError("text_data must be a list.")
         
         try:
-            for item in text_data:
-                self.cursor.execute('''
-                    INSERT INTO text_data (content, page_number) VALUES (%s, %s)
-                ''', (item.get("text", ""), item.get("slide_number", None)))
-            self.connection.commit()
+            text_records = [
+                (item.get("text", ""), item.get("slide_number", None))
+                for item in text_data
+            ]
+            with self._transaction() as cursor:
+                cursor.executemany(INSERT_TEXT_SQL, text_records)
             logging.info("Text data saved to MySQL successfully.")
         except mysql.connector.Error as e:
             logging.error(f"Failed to save text data: {e}")
-            self.connection.rollback()
 
-    def save_images(self, images_data: List[Dict[str, Any]]) -> None:
-        """Save extracted images data to the database."""
-        if not isinstance(images_data, list):
-            raise ValueError("images_data must be a list.")
+    def save_images(self, images_data: Iterable[Dict[str, Any]]) -> None:
+        """Save extracted images data to the database, holding at most one batch of images in memory.
+
+        Images not in an already compressed format are stored zlib-compressed; see _compress_image().
+        """
+        if not isinstance(images_data, Iterable):
+            raise ValueError("images_data must be an iterable.")
         
         try:
-            image_records = [
-                (item["image_data"], item["image_extension"], item.get("page_number", None))
-                for item in images_data
-            ]
-            self.cursor.executemany('''
-                INSERT INTO images_data (image_data, image_extension, page_number) VALUES (%s, %s, %s)
-            ''', image_records)
-            self.connection.commit()
+            with self._transaction() as cursor:
+                images_iter = iter(images_data)
+                while True:
+                    image_records = [_image_record(item) for item in islice(images_iter, IMAGE_BATCH_SIZE)]
+                    if not image_records:
+                        break
+                    cursor.executemany(INSERT_IMAGE_SQL, image_records)
             logging.info("Images data saved to MySQL successfully.")
         except mysql.connector.Error as e:
             logging.error(f"Failed to save images data: {e}")
-            self.connection.rollback()
 
     def save_tables(self, tables_data: List[Dict[str, Any]]) -> None:
         """Save extracted tables data to the database."""
@@ -244,16 +488,15 @@ class MySQLStorage(Storage):
             raise ValueError("tables_data must be a list.")
         
         try:
-            for item in tables_data:
-                table_data_str = str(item['table'])  # Convert table data to a string format
-                self.cursor.execute('''
-                    INSERT INTO tables_data (table_data, page_number) VALUES (%s, %s)
-                ''', (table_data_str, item.get("page_number", None)))
-            self.connection.commit()
+            table_records = [
+                (_dumps_table(item['table']), item.get("page_number", None))  # Store the table as JSON
+                for item in tables_data
+            ]
+            with self._transaction() as cursor:
+                cursor.executemany(INSERT_TABLE_SQL, table_records)
             logging.info("Tables data saved to MySQL successfully.")
         except mysql.connector.Error as e:
             logging.error(f"Failed to save tables data: {e}")
-            self.connection.rollback()
 
     def save_links(self, links_data: List[Dict[str, Any]]) -> None:
         """Save extracted links data to the database."""
@@ -261,21 +504,16 @@ class MySQLStorage(Storage):
             raise ValueError("links_data must be a list.")
         
         try:
-            for item in links_data:
-                self.cursor.execute('''
-                    INSERT INTO links_data (url, page_number) VALUES (%s, %s)
-                ''', (item.get("url", ""), item.get("page_number", None)))
-            self.connection.commit()
+            link_records = [
+                (item.get("url", ""), item.get("page_number", None))
+                for item in links_data
+            ]
+            with self._transaction() as cursor:
+                cursor.executemany(INSERT_LINK_SQL, link_records)
             logging.info("Links data saved to MySQL successfully.")
         except mysql.connector.Error as e:
             logging.error(f"Failed to save links data: {e}")
-            self.connection.rollback()
 
     def close(self) -> None:
-        """Close the database connection."""
-        if self.cursor:
-            self.cursor.close()
-        if self.connection:
-            self.connection.close()
-            logging.info("MySQL database connection closed.")
-
+        """Release the storage. Connections are returned to the shared pool after every save, so none is held here."""
+        self._pool = None